@@ -7,7 +7,7 @@ import json
 import queue
 import threading
 import multiprocessing as mp
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
 import traceback
@@ -17,6 +17,7 @@ class MessageType(Enum):
     """消息类型"""
     # 文件操作
     LOAD_CSV = "load_csv"
+    LOAD_CSV_BATCH = "load_csv_batch"  # 一次请求加载多个文件
     DROP_TABLE = "drop_table"
     CLEAR_ALL = "clear_all"
     GET_TABLES = "get_tables"
@@ -174,6 +175,17 @@ class BackendWorker:
             "encoding": table_info.encoding
         }
     
+    def _handle_load_csv_batch(self, payload: Dict) -> list:
+        """依次加载多个文件，单个文件失败不影响其余文件"""
+        results = []
+        for file_path in payload["file_paths"]:
+            try:
+                info = self._handle_load_csv({"file_path": file_path})
+                results.append({"file_path": file_path, "success": True, "name": info["name"]})
+            except Exception as e:
+                results.append({"file_path": file_path, "success": False, "error": str(e)})
+        return results
+    
     def _handle_drop_table(self, payload: Dict) -> bool:
         return self.engine.drop_table(payload["table_name"])
     
@@ -510,6 +522,14 @@ class IPCClient:
             {"file_path": file_path, "table_name": table_name}
         )
     
+    def load_csv_batch(self, file_paths: List[str]) -> Response:
+        """批量加载CSV文件（一次往返），返回每个文件的加载结果列表"""
+        return self.send_message(
+            MessageType.LOAD_CSV_BATCH,
+            {"file_paths": list(file_paths)},
+            timeout=30.0 * max(1, len(file_paths))
+        )
+    
     def get_tables(self) -> Response:
         """获取所有表"""
         return self.send_message(MessageType.GET_TABLES, {})
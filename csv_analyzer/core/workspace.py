@@ -9,6 +9,7 @@ import uuid
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict, field
+from functools import cached_property
 from datetime import datetime
 
 
@@ -67,6 +68,14 @@ class WorkspaceInfo:
     last_modified: str
     file_count: int = 0
     
+    @cached_property
+    def last_modified_display(self) -> str:
+        """格式化后的修改时间（首次访问时解析一次），无法解析时为空字符串"""
+        try:
+            return datetime.fromisoformat(self.last_modified).strftime("%Y-%m-%d %H:%M")
+        except (TypeError, ValueError):
+            return ""
+    
     @classmethod
     def from_config(cls, config: WorkspaceConfig) -> 'WorkspaceInfo':
         return cls(
@@ -265,13 +274,16 @@ class WorkspaceManager:
         global_config['recent_workspaces'] = recent
         self._save_global_config(global_config)
     
-    def get_recent_workspaces(self) -> List[WorkspaceInfo]:
-        """获取最近使用的工作区"""
+    def get_recent_workspaces(self, limit: Optional[int] = None) -> List[WorkspaceInfo]:
+        """获取最近使用的工作区（列表已按最近使用排序，limit 限制读取的数量）"""
         global_config = self._load_global_config()
         recent = global_config.get('recent_workspaces', [])
         
         workspaces = []
         for item in recent:
+            if limit is not None and len(workspaces) >= limit:
+                break
+            
             workspace_id = item.get('id')
             if not workspace_id:
                 continue
@@ -3,19 +3,34 @@
 支持分页和虚拟滚动
 """
 
+from operator import itemgetter
 from typing import List, Any, Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView, 
     QPushButton, QLabel, QSpinBox, QComboBox, QHeaderView,
     QAbstractItemView, QFrame, QMenu, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal, QPoint
-from PyQt6.QtGui import QFont, QAction
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal, QPoint, QEvent, QTimer
+from PyQt6.QtGui import QFont, QAction, QFontMetrics
 
 from csv_analyzer.frontend.styles.theme import VSCODE_COLORS
 from csv_analyzer.frontend.styles.icons import get_icon
 
 
+# 单元格显示文本的最大长度，超出部分省略（列宽上限为300px，更长的文本不可见）
+MAX_DISPLAY_CHARS = 256
+
+
+def _display_text(value: Any) -> str:
+    """将单元格值转换为显示文本，过长时截断"""
+    if value is None:
+        return "NULL"
+    text = str(value)
+    if len(text) > MAX_DISPLAY_CHARS:
+        return text[:MAX_DISPLAY_CHARS - 3] + "..."
+    return text
+
+
 class DataTableModel(QAbstractTableModel):
     """表格数据模型"""
     
@@ -24,6 +39,8 @@ class DataTableModel(QAbstractTableModel):
         self._columns: List[str] = []
         self._data: List[List[Any]] = []
         self._total_rows: int = 0
+        self._rectangular: bool = True
+        self._col_name_to_idx: dict = {}
     
     def set_data(self, columns: List[str], data: List[List[Any]], total_rows: int):
         """设置数据"""
@@ -31,6 +48,10 @@ class DataTableModel(QAbstractTableModel):
         self._columns = columns
         self._data = data
         self._total_rows = total_rows
+        self._col_name_to_idx = {name: i for i, name in enumerate(columns)}
+        # 设置数据时一次性校验行宽，列提取时无需逐行检查
+        col_count = len(columns)
+        self._rectangular = all(len(row) == col_count for row in data)
         self.endResetModel()
     
     def rowCount(self, parent=QModelIndex()) -> int:
@@ -54,10 +75,7 @@ class DataTableModel(QAbstractTableModel):
             return None
         
         if role == Qt.ItemDataRole.DisplayRole:
-            value = self._data[row][col]
-            if value is None:
-                return "NULL"
-            return str(value)
+            return _display_text(self._data[row][col])
         
         if role == Qt.ItemDataRole.TextAlignmentRole:
             value = self._data[row][col]
@@ -90,9 +108,31 @@ class DataTableModel(QAbstractTableModel):
     def columns(self) -> List[str]:
         return self._columns
     
+    def column_index(self, column_name: str) -> Optional[int]:
+        """按列名查找列索引（不存在返回None）"""
+        return self._col_name_to_idx.get(column_name)
+    
+    @property
+    def is_rectangular(self) -> bool:
+        """所有行的宽度是否与列数一致"""
+        return self._rectangular
+    
     def get_raw_data(self) -> List[List[Any]]:
         """获取原始数据"""
         return self._data
+    
+    def raw_value(self, row: int, col: int) -> Any:
+        """获取单元格原始值（越界返回None）"""
+        if 0 <= row < len(self._data):
+            row_data = self._data[row]
+            if 0 <= col < len(row_data):
+                return row_data[col]
+        return None
+    
+    def full_text(self, row: int, col: int) -> str:
+        """获取单元格完整文本（不截断）"""
+        value = self.raw_value(row, col)
+        return "NULL" if value is None else str(value)
 
 
 class DataTableWidget(QWidget):
@@ -110,8 +150,18 @@ class DataTableWidget(QWidget):
         self._current_page = 1
         self._page_size = 100
         self._total_rows = 0
+        self._total_pages = 1
         self._current_table = ""  # 当前表名
         self._current_sql = ""    # 当前SQL（用于查询结果）
+        self._fm: Optional[QFontMetrics] = None  # 共享的字体度量，字体变化时失效
+        self._last_col_sig: Optional[tuple] = None  # 上次调整列宽时的列签名
+        
+        # 合并快速连续的翻页操作，只按最终页码请求一次数据
+        self._page_change_timer = QTimer(self)
+        self._page_change_timer.setSingleShot(True)
+        self._page_change_timer.setInterval(30)
+        self._page_change_timer.timeout.connect(self._do_emit_page_change)
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -245,43 +295,76 @@ class DataTableWidget(QWidget):
     def set_data(self, columns: List[str], data: List[List[Any]], total_rows: int):
         """设置数据"""
         self._total_rows = total_rows
-        self.model.set_data(columns, data, total_rows)
-        self._update_pagination()
+        self._recompute_total_pages()
         
-        # 自动调整列宽
-        self._auto_resize_columns()
+        # 重载期间屏蔽选择模型信号并暂停重绘，避免模型重置引发的级联回调
+        selection_model = self.table_view.selectionModel()
+        selection_model.blockSignals(True)
+        self.table_view.setUpdatesEnabled(False)
+        try:
+            self.model.set_data(columns, data, total_rows)
+            self._update_pagination()
+            
+            # 自动调整列宽（翻页时列未变化则保留现有列宽）
+            col_sig = tuple(columns)
+            if col_sig != self._last_col_sig:
+                self._auto_resize_columns()
+                self._last_col_sig = col_sig
+        finally:
+            self.table_view.setUpdatesEnabled(True)
+            selection_model.blockSignals(False)
     
     def get_column_data(self, column_name: str) -> List[Any]:
         """获取指定列的所有数据"""
-        try:
-            columns = self.model.columns
-            if column_name not in columns:
-                return []
-            col_idx = columns.index(column_name)
-            raw_data = self.model.get_raw_data()
-            return [row[col_idx] for row in raw_data if col_idx < len(row)]
-        except:
+        col_idx = self.model.column_index(column_name)
+        if col_idx is None:
             return []
+        raw_data = self.model.get_raw_data()
+        if self.model.is_rectangular:
+            return list(map(itemgetter(col_idx), raw_data))
+        return [row[col_idx] for row in raw_data if col_idx < len(row)]
     
     def get_current_data(self) -> tuple:
         """获取当前数据（列名，数据）"""
         return self.model.columns, self.model.get_raw_data()
     
+    def _font_metrics(self) -> QFontMetrics:
+        """获取共享的字体度量对象（惰性创建）"""
+        if self._fm is None:
+            self._fm = QFontMetrics(self.table_view.font())
+        return self._fm
+    
+    def changeEvent(self, event):
+        """字体变化时使缓存的字体度量失效"""
+        if event.type() == QEvent.Type.FontChange:
+            self._fm = None
+        super().changeEvent(event)
+    
     def _auto_resize_columns(self):
         """自动调整列宽"""
         header = self.table_view.horizontalHeader()
-        for i in range(self.model.columnCount()):
-            # 根据内容调整，但限制最大宽度
-            self.table_view.resizeColumnToContents(i)
-            current_width = header.sectionSize(i)
-            if current_width > 300:
-                header.resizeSection(i, 300)
-            elif current_width < 80:
-                header.resizeSection(i, 80)
+        fm = self._font_metrics()
+        columns = self.model.columns
+        raw_data = self.model.get_raw_data()
+        padding = 24  # 单元格内边距及表头排序指示器预留
+        for i, column_name in enumerate(columns):
+            # 根据内容估算宽度，但限制在 80~300 之间
+            width = fm.horizontalAdvance(str(column_name))
+            for row in raw_data:
+                if i >= len(row):
+                    continue
+                width = max(width, fm.horizontalAdvance(_display_text(row[i])))
+                if width + padding >= 300:
+                    break
+            header.resizeSection(i, min(300, max(80, width + padding)))
+    
+    def _recompute_total_pages(self):
+        """重新计算总页数（仅在总行数或每页行数变化时调用）"""
+        self._total_pages = max(1, (self._total_rows + self._page_size - 1) // self._page_size)
     
     def _update_pagination(self):
         """更新分页信息"""
-        total_pages = max(1, (self._total_rows + self._page_size - 1) // self._page_size)
+        total_pages = self._total_pages
         
         self.rows_label.setText(f"共 {self._total_rows:,} 行")
         self.page_label.setText(f"{self._current_page} / {total_pages}")
@@ -295,6 +378,10 @@ class DataTableWidget(QWidget):
         self.last_btn.setEnabled(self._current_page < total_pages)
     
     def _emit_page_change(self):
+        """调度分页变化信号（短时间内的多次调用合并为一次）"""
+        self._page_change_timer.start()
+    
+    def _do_emit_page_change(self):
         """发送分页变化信号"""
         offset = (self._current_page - 1) * self._page_size
         self.page_changed.emit(offset, self._page_size)
@@ -313,16 +400,14 @@ class DataTableWidget(QWidget):
     
     def _go_next(self):
         """下一页"""
-        total_pages = max(1, (self._total_rows + self._page_size - 1) // self._page_size)
-        if self._current_page < total_pages:
+        if self._current_page < self._total_pages:
             self._current_page += 1
             self._emit_page_change()
     
     def _go_last(self):
         """跳转到最后一页"""
-        total_pages = max(1, (self._total_rows + self._page_size - 1) // self._page_size)
-        if self._current_page != total_pages:
-            self._current_page = total_pages
+        if self._current_page != self._total_pages:
+            self._current_page = self._total_pages
             self._emit_page_change()
     
     def _on_page_spin_changed(self, value: int):
@@ -337,6 +422,7 @@ class DataTableWidget(QWidget):
             new_size = int(text)
             if new_size != self._page_size:
                 self._page_size = new_size
+                self._recompute_total_pages()
                 self._current_page = 1
                 self._emit_page_change()
         except ValueError:
@@ -345,8 +431,8 @@ class DataTableWidget(QWidget):
     def _on_cell_double_clicked(self, index: QModelIndex):
         """单元格双击"""
         if index.isValid():
-            value = self.model.data(index, Qt.ItemDataRole.DisplayRole)
-            self.cell_double_clicked.emit(index.row(), index.column(), str(value))
+            value = self.model.full_text(index.row(), index.column())
+            self.cell_double_clicked.emit(index.row(), index.column(), value)
     
     def _on_cell_clicked(self, index: QModelIndex):
         """单元格点击"""
@@ -361,10 +447,16 @@ class DataTableWidget(QWidget):
         if index.isValid():
             row = index.row()
             col = index.column()
-            value = self.model.data(index, Qt.ItemDataRole.DisplayRole)
+            # 直接读取原始值，与信号声明的 object 类型一致
+            value = self.model.raw_value(row, col)
             column_name = self.model._columns[col] if col < len(self.model._columns) else ""
             self.cell_selected.emit(row, col, column_name, value)
     
+    def closeEvent(self, event):
+        """关闭时取消待发送的分页请求"""
+        self._page_change_timer.stop()
+        super().closeEvent(event)
+    
     def _on_header_context_menu(self, pos: QPoint):
         """列头右键菜单"""
         header = self.table_view.horizontalHeader()
@@ -445,6 +537,7 @@ class DataTableWidget(QWidget):
     def set_current_table(self, table_name: str):
         """设置当前表名"""
         self._current_table = table_name
+        self._last_col_sig = None
     
     def get_current_table(self) -> str:
         """获取当前表名"""
@@ -72,6 +72,7 @@ class SidebarWidget(QWidget):
     view_delete_requested = pyqtSignal(str)  # 请求删除视图
     refresh_requested = pyqtSignal()  # 请求刷新
     view_export_requested = pyqtSignal(str, str)  # 视图名, SQL - 请求导出视图
+    tables_changed = pyqtSignal()  # 表列表（及列）发生变化
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -206,6 +207,8 @@ class SidebarWidget(QWidget):
             
             self.tables_tree.addTopLevelItem(item)
             self._tables[table_name] = table
+        
+        self.tables_changed.emit()
     
     def update_views(self, views: dict):
         """更新视图列表"""
@@ -347,6 +350,7 @@ class SidebarWidget(QWidget):
         """清空表列表"""
         self.tables_tree.clear()
         self._tables.clear()
+        self.tables_changed.emit()
     
     def clear_views(self):
         """清空视图列表"""
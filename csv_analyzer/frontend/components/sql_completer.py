@@ -2,72 +2,129 @@
 SQL自动补全器 - 提供SQL关键字和表/列名补全
 """
 
+import heapq
+import sys
+from functools import lru_cache
 from typing import List, Optional, Dict
 from PyQt6.QtWidgets import QCompleter, QPlainTextEdit
-from PyQt6.QtCore import Qt, QStringListModel, QRect
+from PyQt6.QtCore import Qt, QStringListModel, QRect, QTimer
 from PyQt6.QtGui import QTextCursor
 
+from csv_analyzer.frontend.components.sql_vocab import (
+    SQL_KEYWORDS, SQL_FUNCTIONS, STATIC_COMPLETIONS, sort_completions
+)
+
+
+# 决定补全上下文的关键字
+_CONTEXT_KEYWORDS = frozenset({
+    'select', 'from', 'join', 'where', 'and', 'or', 'on', 'having', 'by',
+})
+
+
+def _is_word_char(ch: str) -> bool:
+    """是否为标识符字符"""
+    return ch.isalnum() or ch == '_'
+
+
+@lru_cache(maxsize=128)
+def _detect_context(text_before: str) -> str:
+    """
+    从右向左扫描光标前的文本，返回最近的上下文关键字（小写）
+    
+    ORDER BY / GROUP BY 分别返回 'order by' / 'group by'，未找到时返回空字符串
+    """
+    pos = len(text_before)
+    keyword = ""
+    while pos > 0:
+        # 跳过非标识符字符
+        while pos > 0 and not _is_word_char(text_before[pos - 1]):
+            pos -= 1
+        end = pos
+        while pos > 0 and _is_word_char(text_before[pos - 1]):
+            pos -= 1
+        token = text_before[pos:end].lower()
+        
+        if keyword == 'by':
+            # BY 需要结合前一个词判断
+            return f"{token} by" if token in ('order', 'group') else ""
+        if token in _CONTEXT_KEYWORDS:
+            if token != 'by':
+                return token
+            keyword = token
+    return ""
+
+
+class _PrefixTrie:
+    """大小写不敏感的前缀树，用于按前缀查找补全候选"""
+    
+    def __init__(self):
+        self._root: dict = {}
+    
+    def insert(self, word: str):
+        """插入候选词（按小写建索引，保留原始写法）"""
+        node = self._root
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        # None 键保存以该节点结尾的原始候选词
+        values = node.setdefault(None, [])
+        if word not in values:
+            values.append(word)
+    
+    def keys(self, prefix: str = "") -> List[str]:
+        """返回所有以 prefix 开头的候选词"""
+        node = self._root
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return []
+        
+        result = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is None:
+                    result.extend(child)
+                else:
+                    stack.append(child)
+        return result
+
 
 class SQLCompleter(QCompleter):
     """SQL自动补全器"""
     
-    # SQL关键字
-    SQL_KEYWORDS = [
-        # 基本查询
-        "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "LIKE", "BETWEEN",
-        "IS", "NULL", "AS", "DISTINCT", "ALL", "TOP", "LIMIT", "OFFSET",
-        # 排序和分组
-        "ORDER", "BY", "ASC", "DESC", "GROUP", "HAVING",
-        # 连接
-        "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "FULL", "CROSS", "ON",
-        # 集合操作
-        "UNION", "EXCEPT", "INTERSECT",
-        # 条件
-        "CASE", "WHEN", "THEN", "ELSE", "END",
-        # 数据操作
-        "INSERT", "INTO", "VALUES", "UPDATE", "SET", "DELETE",
-        # DDL
-        "CREATE", "TABLE", "VIEW", "INDEX", "DROP", "ALTER",
-        # 其他
-        "EXISTS", "TRUE", "FALSE", "WITH", "RECURSIVE",
-        # 窗口函数
-        "OVER", "PARTITION", "ROW_NUMBER", "RANK", "DENSE_RANK", "LAG", "LEAD",
-    ]
+    # SQL关键字、函数及静态补全项（共享词汇表）
+    SQL_KEYWORDS = SQL_KEYWORDS
+    SQL_FUNCTIONS = SQL_FUNCTIONS
+    _STATIC_COMPLETIONS = STATIC_COMPLETIONS
     
-    # SQL函数
-    SQL_FUNCTIONS = [
-        # 聚合函数
-        "COUNT(", "SUM(", "AVG(", "MIN(", "MAX(", "TOTAL(",
-        "GROUP_CONCAT(", "MEDIAN(", "STDDEV(", "VARIANCE(",
-        # 数学函数
-        "ABS(", "ROUND(", "FLOOR(", "CEIL(", "CEILING(", "SQRT(", "POWER(", "MOD(",
-        "RANDOM(", "SIGN(", "LOG(", "LN(", "EXP(",
-        # 字符串函数
-        "LENGTH(", "LOWER(", "UPPER(", "TRIM(", "LTRIM(", "RTRIM(",
-        "SUBSTR(", "SUBSTRING(", "REPLACE(", "CONCAT(", "INSTR(",
-        "LEFT(", "RIGHT(", "REPEAT(", "REVERSE(",
-        # 转换函数
-        "CAST(", "COALESCE(", "NULLIF(", "IFNULL(", "TYPEOF(",
-        # 日期函数
-        "DATE(", "TIME(", "DATETIME(", "STRFTIME(",
-        "YEAR(", "MONTH(", "DAY(", "HOUR(", "MINUTE(", "SECOND(",
-        # 条件函数
-        "IIF(", "CASE",
-        # 分析函数
-        "FIRST(", "LAST(", "LIST(",
-        "QUANTILE(", "QUANTILE_CONT(", "PERCENTILE(",
-    ]
+    # 上下文补全返回的最大条数
+    MAX_COMPLETIONS = 200
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self._tables: Dict[str, List[str]] = {}  # table_name -> [columns]
         self._views: List[str] = []
+        self._trie = _PrefixTrie()
+        self._last_completions: tuple = ()
+        
+        # 持久的补全模型，内容变化时才更新
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        
+        # 合并短时间内连续的表/视图更新
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(50)
+        self._rebuild_timer.timeout.connect(self._update_model)
         
         # 设置补全模式
         self.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        # 模型按大小写不敏感排序，前缀匹配可走二分查找
+        self.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
         
         # 初始化模型
         self._update_model()
@@ -79,47 +136,43 @@ class SQLCompleter(QCompleter):
         Args:
             tables: {table_name: [column_names]}
         """
-        self._tables = tables
-        self._update_model()
+        # 驻留标识符字符串，重复出现的表名/列名共享同一对象
+        self._tables = {
+            sys.intern(name): [sys.intern(col) for col in columns]
+            for name, columns in tables.items()
+        }
+        self._rebuild_timer.start()
     
     def set_views(self, views: List[str]):
         """设置视图列表"""
         self._views = views
-        self._update_model()
+        self._rebuild_timer.start()
     
     def _update_model(self):
         """更新补全模型"""
-        completions = []
-        
-        # 添加关键字
-        completions.extend(self.SQL_KEYWORDS)
-        completions.extend([kw.lower() for kw in self.SQL_KEYWORDS])
-        
-        # 添加函数
-        completions.extend(self.SQL_FUNCTIONS)
-        completions.extend([f.lower() for f in self.SQL_FUNCTIONS])
-        
-        # 添加表名
-        for table_name in self._tables.keys():
-            completions.append(table_name)
-            completions.append(f'"{table_name}"')
+        # 关键字和函数（预先计算）
+        completions = list(self._STATIC_COMPLETIONS)
         
-        # 添加列名（带表名前缀和不带）
-        for table_name, columns in self._tables.items():
-            for col in columns:
-                completions.append(col)
-                completions.append(f'"{col}"')
-                completions.append(f"{table_name}.{col}")
-                completions.append(f'"{table_name}"."{col}"')
+        # 添加表名和列名（"表名.列名" 形式在输入 "表名." 时按需生成）
+        completions.extend(self._tables.keys())
+        for columns in self._tables.values():
+            completions.extend(columns)
         
         # 添加视图
         completions.extend(self._views)
         
         # 去重并排序
-        completions = sorted(set(completions))
+        completions = tuple(sys.intern(c) for c in sort_completions(set(completions)))
+        if completions == self._last_completions:
+            return
+        self._last_completions = completions
+        
+        # 重建前缀树，供上下文补全做前缀查找
+        self._trie = _PrefixTrie()
+        for completion in completions:
+            self._trie.insert(completion)
         
-        model = QStringListModel(completions, self)
-        self.setModel(model)
+        self._model.setStringList(list(completions))
     
     def get_completions_for_context(self, text: str, cursor_pos: int) -> List[str]:
         """
@@ -139,36 +192,46 @@ class SQLCompleter(QCompleter):
         
         current_word = text[word_start:cursor_pos].upper()
         
-        # 分析上下文
-        text_before = text[:cursor_pos].upper()
+        # 输入了 "表名." 时，只补全该表的列
+        if '.' in current_word:
+            table_name, _, suffix = text[word_start:cursor_pos].rpartition('.')
+            table_name = table_name.strip('"')
+            columns = self._tables.get(table_name)
+            if columns is None:
+                return []
+            suffix = suffix.strip('"').upper()
+            return [f"{table_name}.{c}" for c in columns
+                    if c.upper().startswith(suffix)][:self.MAX_COMPLETIONS]
+        
+        # 分析上下文（只向前扫描到最近的关键字，不复制整段文本做大写转换）
+        context = _detect_context(text[:word_start])
         
         completions = []
         
-        # 在FROM后面，建议表名
-        if 'FROM' in text_before and not any(kw in text_before.split('FROM')[-1] for kw in ['WHERE', 'GROUP', 'ORDER', 'JOIN']):
+        # 在FROM/JOIN后面，建议表名
+        if context in ('from', 'join'):
             completions.extend(self._tables.keys())
             completions.extend(self._views)
         
         # 在SELECT后面，建议列名和函数
-        elif 'SELECT' in text_before and 'FROM' not in text_before:
+        elif context == 'select':
             completions.extend(self.SQL_FUNCTIONS)
             for columns in self._tables.values():
                 completions.extend(columns)
         
-        # 在WHERE/AND/OR后面，建议列名
-        elif any(kw in text_before.split()[-2:] if len(text_before.split()) >= 2 else False 
-                 for kw in ['WHERE', 'AND', 'OR']):
+        # 在WHERE/AND/OR/ON/HAVING后面，建议列名
+        elif context in ('where', 'and', 'or', 'on', 'having'):
             for columns in self._tables.values():
                 completions.extend(columns)
         
         # 在ORDER BY后面，建议列名
-        elif 'ORDER BY' in text_before:
+        elif context == 'order by':
             for columns in self._tables.values():
                 completions.extend(columns)
             completions.extend(['ASC', 'DESC'])
         
         # 在GROUP BY后面，建议列名
-        elif 'GROUP BY' in text_before:
+        elif context == 'group by':
             for columns in self._tables.values():
                 completions.extend(columns)
         
@@ -178,11 +241,17 @@ class SQLCompleter(QCompleter):
             completions.extend(self.SQL_FUNCTIONS)
             completions.extend(self._tables.keys())
         
-        # 过滤匹配当前词的
+        # 通过前缀树过滤匹配当前词的
         if current_word:
-            completions = [c for c in completions if current_word in c.upper()]
-        
-        return sorted(set(completions))
+            hits = set(self._trie.keys(current_word))
+            completions = [c for c in completions if c in hits]
+        
+        # 只取最相关的前 MAX_COMPLETIONS 条：前缀匹配优先，其次较短者，最后按字母序
+        return heapq.nsmallest(
+            self.MAX_COMPLETIONS,
+            set(completions),
+            key=lambda c: (0 if c.upper().startswith(current_word) else 1, len(c), c),
+        )
 
 
 class CompletableTextEdit:
@@ -209,9 +278,14 @@ class CompletableTextEdit:
     
     def _get_word_under_cursor(self) -> str:
         """获取光标下的词"""
+        # 直接扫描当前块文本，避免移动光标做分词
         cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.StartOfWord, QTextCursor.MoveMode.KeepAnchor)
-        return cursor.selectedText()
+        block_text = cursor.block().text()
+        pos = cursor.positionInBlock()
+        start = pos
+        while start > 0 and (block_text[start - 1].isalnum() or block_text[start - 1] == '_'):
+            start -= 1
+        return block_text[start:pos]
     
     def _show_completer(self):
         """显示补全器"""
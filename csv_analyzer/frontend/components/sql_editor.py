@@ -2,12 +2,16 @@
 SQL编辑器组件 - 带语法高亮的SQL编辑器
 """
 
+import sys
 from typing import Dict, List
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
     QPushButton, QLabel, QSplitter, QFrame, QCompleter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QRegularExpression, QStringListModel
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QRegularExpression, QStringListModel, QTimer,
+    QObject, QRunnable, QThreadPool
+)
 from PyQt6.QtGui import (
     QFont, QTextCharFormat, QColor, QSyntaxHighlighter,
     QTextDocument, QKeySequence, QShortcut, QTextCursor
@@ -15,106 +19,162 @@ from PyQt6.QtGui import (
 
 from csv_analyzer.frontend.styles.theme import VSCODE_COLORS
 from csv_analyzer.frontend.styles.icons import get_icon
+from csv_analyzer.frontend.components.sql_vocab import (
+    SQL_KEYWORDS, SQL_FUNCTIONS, STATIC_COMPLETIONS, sort_completions,
+    KEYWORD_REGEX, FUNCTION_REGEX, FORMAT_RE
+)
+
+
+class _FormatSignals(QObject):
+    """格式化任务的信号（QRunnable 本身不能发信号）"""
+    
+    finished = pyqtSignal(str, str)  # 原始SQL, 格式化后的SQL
+
+
+class _FormatTask(QRunnable):
+    """在线程池中执行SQL格式化"""
+    
+    def __init__(self, sql: str, format_func):
+        super().__init__()
+        self.sql = sql
+        self.format_func = format_func
+        self.signals = _FormatSignals()
+    
+    def run(self):
+        self.signals.finished.emit(self.sql, self.format_func(self.sql))
 
 
 class SQLHighlighter(QSyntaxHighlighter):
     """SQL语法高亮器"""
     
+    # 按文本缓存的单行规则高亮结果的最大条数
+    MAX_CACHED_BLOCKS = 2000
+    # 超过该长度的块（如压缩成一行的SQL）不做单行规则高亮
+    MAX_HIGHLIGHT_LENGTH = 10000
+    
     def __init__(self, parent: QTextDocument = None):
         super().__init__(parent)
+        # 块文本 -> ((start, length, format), ...)，未修改的块直接复用
+        self._format_cache: Dict[str, tuple] = {}
         self._init_rules()
     
     def _init_rules(self):
         """初始化高亮规则"""
-        self.rules = []
+        rules = []
         
         # SQL关键字
         keyword_format = QTextCharFormat()
         keyword_format.setForeground(QColor(VSCODE_COLORS['keyword']))
         keyword_format.setFontWeight(QFont.Weight.Bold)
         
-        keywords = [
-            'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'NOT', 'IN', 'LIKE',
-            'ORDER', 'BY', 'ASC', 'DESC', 'GROUP', 'HAVING', 'JOIN',
-            'LEFT', 'RIGHT', 'INNER', 'OUTER', 'FULL', 'CROSS', 'ON',
-            'AS', 'DISTINCT', 'ALL', 'TOP', 'LIMIT', 'OFFSET',
-            'INSERT', 'INTO', 'VALUES', 'UPDATE', 'SET', 'DELETE',
-            'CREATE', 'TABLE', 'VIEW', 'INDEX', 'DROP', 'ALTER',
-            'NULL', 'IS', 'BETWEEN', 'EXISTS', 'CASE', 'WHEN', 'THEN',
-            'ELSE', 'END', 'UNION', 'EXCEPT', 'INTERSECT',
-            'COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'CAST', 'COALESCE',
-            'TRUE', 'FALSE', 'WITH', 'RECURSIVE', 'OVER', 'PARTITION',
-            'ROW_NUMBER', 'RANK', 'DENSE_RANK', 'LAG', 'LEAD'
-        ]
-        
-        for keyword in keywords:
-            pattern = QRegularExpression(r'\b' + keyword + r'\b', 
-                                          QRegularExpression.PatternOption.CaseInsensitiveOption)
-            self.rules.append((pattern, keyword_format))
+        # 所有关键字合并为一个交替正则（共享预编译对象）
+        rules.append((KEYWORD_REGEX, keyword_format))
         
         # 函数
         function_format = QTextCharFormat()
         function_format.setForeground(QColor(VSCODE_COLORS['function']))
         
-        functions = [
-            'COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'ROUND', 'FLOOR', 'CEIL',
-            'ABS', 'SQRT', 'POWER', 'LENGTH', 'LOWER', 'UPPER', 'TRIM',
-            'SUBSTR', 'SUBSTRING', 'REPLACE', 'CONCAT', 'COALESCE',
-            'NULLIF', 'IFNULL', 'DATE', 'TIME', 'DATETIME', 'STRFTIME',
-            'TYPEOF', 'CAST', 'PRINTF', 'INSTR', 'HEX', 'QUOTE',
-            'RANDOM', 'TOTAL', 'GROUP_CONCAT', 'MEDIAN', 'STDDEV',
-            'QUANTILE', 'QUANTILE_CONT', 'FIRST', 'LAST', 'LIST'
-        ]
-        
-        for func in functions:
-            pattern = QRegularExpression(r'\b' + func + r'\s*\(', 
-                                          QRegularExpression.PatternOption.CaseInsensitiveOption)
-            self.rules.append((pattern, function_format))
+        rules.append((FUNCTION_REGEX, function_format))
         
         # 字符串（单引号）
         string_format = QTextCharFormat()
         string_format.setForeground(QColor(VSCODE_COLORS['string']))
-        self.rules.append((QRegularExpression(r"'[^']*'"), string_format))
         
         # 字符串（双引号 - 标识符）
         identifier_format = QTextCharFormat()
         identifier_format.setForeground(QColor(VSCODE_COLORS['variable']))
-        self.rules.append((QRegularExpression(r'"[^"]*"'), identifier_format))
         
         # 数字
         number_format = QTextCharFormat()
         number_format.setForeground(QColor(VSCODE_COLORS['number']))
-        self.rules.append((QRegularExpression(r'\b\d+\.?\d*\b'), number_format))
         
         # 运算符
         operator_format = QTextCharFormat()
         operator_format.setForeground(QColor(VSCODE_COLORS['foreground']))
-        self.rules.append((QRegularExpression(r'[=<>!]+|[+\-*/%]'), operator_format))
         
         # 注释（单行）
         comment_format = QTextCharFormat()
         comment_format.setForeground(QColor(VSCODE_COLORS['comment']))
         comment_format.setFontItalic(True)
-        self.rules.append((QRegularExpression(r'--[^\n]*'), comment_format))
+        
+        # 注释/字符串/标识符/数字/运算符合并为一个分词正则，按命中的分组着色
+        # （注释在运算符之前，保证 -- 不会被拆成两个减号）
+        self._token_expr = QRegularExpression(
+            r"(?<cmt>--[^\n]*)|(?<str>'[^']*')|(?<ident>\"[^\"]*\")"
+            r"|(?<num>\b\d+\.?\d*\b)|(?<op>[=<>!]+|[+\-*/%])"
+        )
+        self._token_expr.optimize()
+        self._token_formats = (
+            ('cmt', comment_format),
+            ('str', string_format),
+            ('ident', identifier_format),
+            ('num', number_format),
+            ('op', operator_format),
+        )
         
         # 注释（多行）
         self.multi_comment_format = comment_format
+        self._comment_start_expr = QRegularExpression(r'/\*')
+        self._comment_end_expr = QRegularExpression(r'\*/')
+        
+        # 关键字/函数正则已在 sql_vocab 中编译，这里只预先编译本地的注释正则
+        for pattern in (self._comment_start_expr, self._comment_end_expr):
+            pattern.optimize()
+        
+        self.rules = tuple(rules)
     
     def highlightBlock(self, text: str):
         """高亮文本块"""
-        for pattern, fmt in self.rules:
+        # 处于多行注释内部且本块未结束注释：整块按注释着色，跳过所有规则
+        if self.previousBlockState() == 1 and '*/' not in text:
+            self.setFormat(0, len(text), self.multi_comment_format)
+            self.setCurrentBlockState(1)
+            return
+        
+        # 超长块只维护多行注释状态
+        if len(text) > self.MAX_HIGHLIGHT_LENGTH:
+            self._highlight_multiline_comments(text)
+            return
+        
+        # Qt 每次调用前都会清空块格式，因此命中缓存时重新应用格式，仅跳过正则匹配
+        formats = self._format_cache.get(text)
+        if formats is None:
+            formats = self._match_rules(text)
+            if len(self._format_cache) >= self.MAX_CACHED_BLOCKS:
+                self._format_cache.clear()
+            self._format_cache[text] = formats
+        
+        for start, length, fmt in formats:
+            self.setFormat(start, length, fmt)
+        
+        # 处理多行注释（依赖上一块状态，每次都需执行）
+        self._highlight_multiline_comments(text)
+    
+    def _match_rules(self, text: str) -> tuple:
+        """对文本块执行单行高亮规则，返回格式区间"""
+        formats = []
+        rules = self.rules
+        for pattern, fmt in rules:
             match_iterator = pattern.globalMatch(text)
             while match_iterator.hasNext():
                 match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), fmt)
-        
-        # 处理多行注释
-        self._highlight_multiline_comments(text)
+                formats.append((match.capturedStart(), match.capturedLength(), fmt))
+        
+        # 分词正则单次扫描
+        token_formats = self._token_formats
+        match_iterator = self._token_expr.globalMatch(text)
+        while match_iterator.hasNext():
+            match = match_iterator.next()
+            for name, fmt in token_formats:
+                if match.capturedStart(name) >= 0:
+                    formats.append((match.capturedStart(), match.capturedLength(), fmt))
+                    break
+        return tuple(formats)
     
     def _highlight_multiline_comments(self, text: str):
         """处理多行注释"""
-        start_expr = QRegularExpression(r'/\*')
-        end_expr = QRegularExpression(r'\*/')
+        start_expr = self._comment_start_expr
+        end_expr = self._comment_end_expr
         
         self.setCurrentBlockState(0)
         
@@ -144,31 +204,17 @@ class SQLEditor(QPlainTextEdit):
     execute_requested = pyqtSignal(str)  # 执行SQL请求
     
     # SQL关键字和函数用于自动补全
-    SQL_KEYWORDS = [
-        "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "LIKE", "BETWEEN",
-        "IS", "NULL", "AS", "DISTINCT", "ALL", "TOP", "LIMIT", "OFFSET",
-        "ORDER", "BY", "ASC", "DESC", "GROUP", "HAVING",
-        "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "FULL", "CROSS", "ON",
-        "UNION", "EXCEPT", "INTERSECT", "CASE", "WHEN", "THEN", "ELSE", "END",
-        "INSERT", "INTO", "VALUES", "UPDATE", "SET", "DELETE",
-        "CREATE", "TABLE", "VIEW", "INDEX", "DROP", "ALTER",
-        "EXISTS", "TRUE", "FALSE", "WITH", "RECURSIVE",
-        "OVER", "PARTITION", "ROW_NUMBER", "RANK", "DENSE_RANK", "LAG", "LEAD",
-    ]
-    
-    SQL_FUNCTIONS = [
-        "COUNT()", "SUM()", "AVG()", "MIN()", "MAX()", "TOTAL()",
-        "ABS()", "ROUND()", "FLOOR()", "CEIL()", "SQRT()", "POWER()",
-        "LENGTH()", "LOWER()", "UPPER()", "TRIM()", "SUBSTR()", "REPLACE()", "CONCAT()",
-        "CAST()", "COALESCE()", "NULLIF()", "IFNULL()",
-        "DATE()", "TIME()", "DATETIME()", "STRFTIME()",
-        "MEDIAN()", "STDDEV()", "QUANTILE()", "GROUP_CONCAT()",
-    ]
+    SQL_KEYWORDS = SQL_KEYWORDS
+    SQL_FUNCTIONS = SQL_FUNCTIONS
+    _STATIC_COMPLETIONS = STATIC_COMPLETIONS
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self._tables: Dict[str, List[str]] = {}
         self._completer: QCompleter = None
+        self._completer_model: QStringListModel = None
+        self._last_completions: tuple = ()
+        self._substring_mode = False  # 模型当前是否为临时结果（子串匹配或某表的列）
         self._setup_editor()
         self._setup_shortcuts()
         self._setup_completer()
@@ -229,12 +275,23 @@ class SQLEditor(QPlainTextEdit):
     def _setup_completer(self):
         """设置自动补全"""
         self._completer = QCompleter(self)
+        self._completer_model = QStringListModel(self._completer)
+        self._completer.setModel(self._completer_model)
         self._completer.setWidget(self)
         self._completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
         self._completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self._completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        # 普通输入走前缀匹配；子串匹配只在 Ctrl+Space 时计算
+        self._completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        # 模型按大小写不敏感排序，前缀匹配可走二分查找
+        self._completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
         self._completer.activated.connect(self._insert_completion)
         
+        # 连续输入时只在最后一次按键后弹出补全
+        self._completion_timer = QTimer(self)
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(40)
+        self._completion_timer.timeout.connect(self._show_completer)
+        
         # 设置补全弹出样式
         popup = self._completer.popup()
         popup.setStyleSheet(f"""
@@ -250,43 +307,89 @@ class SQLEditor(QPlainTextEdit):
     
     def _update_completer_model(self):
         """更新补全模型"""
-        completions = []
-        
-        # 添加关键字（大小写）
-        for kw in self.SQL_KEYWORDS:
-            completions.append(kw)
-            completions.append(kw.lower())
+        # 关键字和函数（预先计算）
+        completions = list(self._STATIC_COMPLETIONS)
         
-        # 添加函数
-        completions.extend(self.SQL_FUNCTIONS)
-        completions.extend([f.lower() for f in self.SQL_FUNCTIONS])
+        # 添加表名和列名（"表名." 之后的列补全在弹出时按需生成）
+        completions.extend(self._tables.keys())
+        for columns in self._tables.values():
+            completions.extend(columns)
         
-        # 添加表和列
-        for table_name, columns in self._tables.items():
-            completions.append(table_name)
-            completions.append(f'"{table_name}"')
-            for col in columns:
-                completions.append(col)
-                completions.append(f'"{col}"')
-                completions.append(f"{table_name}.{col}")
-        
-        model = QStringListModel(sorted(set(completions)), self._completer)
-        self._completer.setModel(model)
+        # 补全项未变化时不重置模型
+        completions = tuple(sys.intern(c) for c in sort_completions(set(completions)))
+        if completions == self._last_completions and not self._substring_mode:
+            return
+        self._last_completions = completions
+        self._substring_mode = False
+        self._completer_model.setStringList(list(completions))
     
     def set_tables(self, tables: Dict[str, List[str]]):
         """设置表信息用于自动补全"""
-        self._tables = tables
+        # 驻留标识符字符串，重复出现的表名/列名共享同一对象
+        self._tables = {
+            sys.intern(name): [sys.intern(col) for col in columns]
+            for name, columns in tables.items()
+        }
         self._update_completer_model()
     
     def _get_word_under_cursor(self) -> str:
-        """获取光标下的词"""
+        """获取光标下的词（光标前的标识符部分）"""
+        # 直接扫描当前块文本，避免 select(WordUnderCursor) 的分词开销
         cursor = self.textCursor()
-        cursor.select(QTextCursor.SelectionType.WordUnderCursor)
-        return cursor.selectedText()
+        block_text = cursor.block().text()
+        pos = cursor.positionInBlock()
+        start = pos
+        while start > 0 and (block_text[start - 1].isalnum() or block_text[start - 1] == '_'):
+            start -= 1
+        return block_text[start:pos]
     
     def _trigger_completion(self):
-        """触发自动补全"""
-        self._show_completer()
+        """触发自动补全（子串匹配）"""
+        prefix = self._get_word_under_cursor()
+        
+        if not prefix:
+            self._completer.popup().hide()
+            return
+        
+        # 仅本次调用将模型替换为子串匹配结果，下次普通输入时恢复
+        needle = prefix.upper()
+        hits = [c for c in self._last_completions if needle in c.upper()]
+        self._completer_model.setStringList(hits)
+        self._substring_mode = True
+        self._completer.setCompletionPrefix("")
+        self._popup_completer()
+    
+    def _restore_completer_model(self):
+        """恢复完整补全模型"""
+        if self._substring_mode:
+            self._completer_model.setStringList(list(self._last_completions))
+            self._substring_mode = False
+    
+    def _get_table_before_dot(self) -> str:
+        """若光标处的词紧跟在 "表名." 之后且表名已知，返回该表名"""
+        cursor = self.textCursor()
+        text = cursor.block().text()[:cursor.positionInBlock()]
+        
+        # 跳过当前词
+        pos = len(text)
+        while pos > 0 and (text[pos - 1].isalnum() or text[pos - 1] == '_'):
+            pos -= 1
+        if pos == 0 or text[pos - 1] != '.':
+            return ""
+        end = pos - 1
+        
+        # 支持 "表名". 和 表名. 两种写法
+        if end > 0 and text[end - 1] == '"':
+            start = text.rfind('"', 0, end - 1)
+            if start < 0:
+                return ""
+            table_name = text[start + 1:end - 1]
+        else:
+            start = end
+            while start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                start -= 1
+            table_name = text[start:end]
+        return table_name if table_name in self._tables else ""
     
     def _show_completer(self):
         """显示补全器"""
@@ -296,8 +399,18 @@ class SQLEditor(QPlainTextEdit):
             self._completer.popup().hide()
             return
         
+        table_name = self._get_table_before_dot()
+        if table_name:
+            # "表名." 之后只补全该表的列
+            self._completer_model.setStringList(sort_completions(self._tables[table_name]))
+            self._substring_mode = True
+        else:
+            self._restore_completer_model()
         self._completer.setCompletionPrefix(prefix)
-        
+        self._popup_completer()
+    
+    def _popup_completer(self):
+        """在光标处弹出补全列表"""
         popup = self._completer.popup()
         popup.setCurrentIndex(self._completer.completionModel().index(0, 0))
         
@@ -336,10 +449,12 @@ class SQLEditor(QPlainTextEdit):
         if event.text() and event.text().isalnum() or event.text() == '_':
             prefix = self._get_word_under_cursor()
             if len(prefix) >= 2:  # 至少输入2个字符才触发
-                self._show_completer()
+                self._completion_timer.start()
             else:
+                self._completion_timer.stop()
                 self._completer.popup().hide()
         elif event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Backspace):
+            self._completion_timer.stop()
             self._completer.popup().hide()
     
     def _on_execute(self):
@@ -365,6 +480,7 @@ class SQLEditorWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._tables: Dict[str, List[str]] = {}
+        self._format_task: _FormatTask = None
         self._setup_ui()
     
     def _setup_ui(self):
@@ -449,28 +565,31 @@ class SQLEditorWidget(QWidget):
             self.save_view_requested.emit(sql)
     
     def _on_format(self):
-        """格式化SQL"""
+        """格式化SQL（在线程池中执行，避免大段SQL卡住界面）"""
+        if self._format_task is not None:
+            return
+        
         sql = self.editor.toPlainText()
-        formatted = self._format_sql(sql)
-        self.editor.setPlainText(formatted)
+        self._format_task = _FormatTask(sql, self._format_sql)
+        self._format_task.signals.finished.connect(self._on_format_finished)
+        self.format_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(self._format_task)
+    
+    def _on_format_finished(self, sql: str, formatted: str):
+        """格式化完成"""
+        self._format_task = None
+        self.format_btn.setEnabled(True)
+        # 格式化期间内容被修改则放弃结果，避免覆盖用户输入
+        if self.editor.toPlainText() == sql:
+            self.editor.setPlainText(formatted)
     
     def _format_sql(self, sql: str) -> str:
         """简单的SQL格式化"""
-        keywords = [
-            'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'ORDER BY', 
-            'GROUP BY', 'HAVING', 'JOIN', 'LEFT JOIN', 'RIGHT JOIN',
-            'INNER JOIN', 'OUTER JOIN', 'ON', 'LIMIT', 'OFFSET',
-            'UNION', 'EXCEPT', 'INTERSECT', 'INSERT INTO', 'VALUES',
-            'UPDATE', 'SET', 'DELETE FROM', 'CREATE TABLE', 'CREATE VIEW'
-        ]
-        
         # 规范化空白
         sql = ' '.join(sql.split())
         
-        # 在关键字前添加换行
-        for kw in sorted(keywords, key=len, reverse=True):
-            sql = sql.replace(f' {kw} ', f'\n{kw} ')
-            sql = sql.replace(f' {kw.lower()} ', f'\n{kw} ')
+        # 在关键字前添加换行（单次正则替换）
+        sql = FORMAT_RE.sub(lambda m: '\n' + m.group(1).upper(), sql)
         
         # 清理多余空行
         lines = [line.strip() for line in sql.split('\n') if line.strip()]
@@ -0,0 +1,111 @@
+"""
+SQL词汇表 - 编辑器、补全器、高亮器共用的关键字/函数及预编译结构
+"""
+
+import re
+
+from PyQt6.QtCore import QRegularExpression
+
+
+# SQL关键字
+SQL_KEYWORDS = (
+    # 基本查询
+    "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "LIKE", "BETWEEN",
+    "IS", "NULL", "AS", "DISTINCT", "ALL", "TOP", "LIMIT", "OFFSET",
+    # 排序和分组
+    "ORDER", "BY", "ASC", "DESC", "GROUP", "HAVING",
+    # 连接
+    "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "FULL", "CROSS", "ON",
+    # 集合操作
+    "UNION", "EXCEPT", "INTERSECT",
+    # 条件
+    "CASE", "WHEN", "THEN", "ELSE", "END",
+    # 数据操作
+    "INSERT", "INTO", "VALUES", "UPDATE", "SET", "DELETE",
+    # DDL
+    "CREATE", "TABLE", "VIEW", "INDEX", "DROP", "ALTER",
+    # 其他
+    "EXISTS", "TRUE", "FALSE", "WITH", "RECURSIVE",
+    # 窗口函数
+    "OVER", "PARTITION", "ROW_NUMBER", "RANK", "DENSE_RANK", "LAG", "LEAD",
+)
+
+# SQL函数名
+SQL_FUNCTION_NAMES = (
+    # 聚合函数
+    "COUNT", "SUM", "AVG", "MIN", "MAX", "TOTAL",
+    "GROUP_CONCAT", "MEDIAN", "STDDEV", "VARIANCE",
+    # 数学函数
+    "ABS", "ROUND", "FLOOR", "CEIL", "CEILING", "SQRT", "POWER", "MOD",
+    "RANDOM", "SIGN", "LOG", "LN", "EXP",
+    # 字符串函数
+    "LENGTH", "LOWER", "UPPER", "TRIM", "LTRIM", "RTRIM",
+    "SUBSTR", "SUBSTRING", "REPLACE", "CONCAT", "INSTR",
+    "LEFT", "RIGHT", "REPEAT", "REVERSE", "PRINTF", "HEX", "QUOTE",
+    # 转换函数
+    "CAST", "COALESCE", "NULLIF", "IFNULL", "TYPEOF",
+    # 日期函数
+    "DATE", "TIME", "DATETIME", "STRFTIME",
+    "YEAR", "MONTH", "DAY", "HOUR", "MINUTE", "SECOND",
+    # 条件函数
+    "IIF",
+    # 分析函数
+    "FIRST", "LAST", "LIST",
+    "QUANTILE", "QUANTILE_CONT", "PERCENTILE",
+)
+
+# 补全时插入的函数形式
+SQL_FUNCTIONS = tuple(f"{name}()" for name in SQL_FUNCTION_NAMES)
+
+# 高亮时按关键字着色的常用函数
+_HIGHLIGHT_EXTRA_KEYWORDS = ("COUNT", "SUM", "AVG", "MIN", "MAX", "CAST", "COALESCE")
+
+# 预先计算的小写形式
+SQL_KEYWORDS_LOWER = frozenset(kw.lower() for kw in SQL_KEYWORDS)
+SQL_FUNCTIONS_LOWER = frozenset(f.lower() for f in SQL_FUNCTIONS)
+
+
+def sort_completions(items) -> list:
+    """按大小写不敏感顺序排序补全项（QCompleter 声明 CaseInsensitivelySortedModel 时要求）"""
+    return sorted(items, key=lambda item: (item.lower(), item))
+
+
+# 静态补全项（关键字+函数，大小写两种写法）
+STATIC_COMPLETIONS = tuple(sort_completions(
+    set(SQL_KEYWORDS) | SQL_KEYWORDS_LOWER | set(SQL_FUNCTIONS) | SQL_FUNCTIONS_LOWER
+))
+
+
+def _compile_highlight_regex(pattern: str) -> QRegularExpression:
+    """编译高亮用的正则（大小写不敏感、不捕获）"""
+    regex = QRegularExpression(
+        pattern,
+        QRegularExpression.PatternOption.CaseInsensitiveOption
+        | QRegularExpression.PatternOption.DontCaptureOption
+    )
+    regex.optimize()
+    return regex
+
+
+# 所有关键字/函数各合并为一个交替正则，每个文本块只需扫描一次
+KEYWORD_REGEX = _compile_highlight_regex(
+    r'\b(' + '|'.join(SQL_KEYWORDS + _HIGHLIGHT_EXTRA_KEYWORDS) + r')\b'
+)
+FUNCTION_REGEX = _compile_highlight_regex(
+    r'\b(' + '|'.join(SQL_FUNCTION_NAMES) + r')\s*\('
+)
+
+# SQL格式化时需要换行的关键字
+FORMAT_KEYWORDS = (
+    'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'ORDER BY',
+    'GROUP BY', 'HAVING', 'JOIN', 'LEFT JOIN', 'RIGHT JOIN',
+    'INNER JOIN', 'OUTER JOIN', 'ON', 'LIMIT', 'OFFSET',
+    'UNION', 'EXCEPT', 'INTERSECT', 'INSERT INTO', 'VALUES',
+    'UPDATE', 'SET', 'DELETE FROM', 'CREATE TABLE', 'CREATE VIEW',
+)
+
+# 长关键字在前，保证 LEFT JOIN 优先于 JOIN 匹配
+FORMAT_RE = re.compile(
+    r'\s+(' + '|'.join(re.escape(kw) for kw in sorted(FORMAT_KEYWORDS, key=len, reverse=True)) + r')(?=\s)',
+    re.IGNORECASE
+)
@@ -2,20 +2,87 @@
 欢迎页组件 - 在数据区域显示，类似VSCode
 """
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QFrame, QSizePolicy,
-    QAbstractItemView, QScrollArea
+    QFrame, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent
+from PyQt6.QtGui import QFont, QPainter, QColor
 
 from csv_analyzer.core.workspace import WorkspaceManager, WorkspaceInfo
 from csv_analyzer.frontend.styles.theme import VSCODE_COLORS
-from csv_analyzer.frontend.styles.icons import get_icon
+from csv_analyzer.frontend.styles.icons import get_icon, get_pixmap
+
+
+# 共享字体（QFont 为隐式共享，多个控件复用同一实例是安全的）
+_FONT_NAME = QFont("Segoe UI", 10)
+_FONT_DETAIL = QFont("Segoe UI", 9)
+_FONT_TITLE = QFont("Segoe UI", 28, QFont.Weight.Light)
+_FONT_SUBTITLE = QFont("Segoe UI", 12)
+_FONT_SECTION = QFont("Segoe UI", 11, QFont.Weight.DemiBold)
+
+
+# 样式表（主题确定后不再变化，模块加载时生成一次）
+_PRIMARY_TEXT_QSS = f"color: {VSCODE_COLORS['foreground']};"
+_SECONDARY_TEXT_QSS = f"color: {VSCODE_COLORS['text_secondary']};"
+_HOVER_COLOR = QColor(VSCODE_COLORS['hover'])
+_EMPTY_HINT_QSS = f"color: {VSCODE_COLORS['text_secondary']}; padding: 8px 0;"
+
+_WELCOME_QSS = f"""
+    QWidget#welcomePage {{
+        background-color: {VSCODE_COLORS['background']};
+    }}
+    QScrollArea {{
+        background-color: {VSCODE_COLORS['background']};
+        border: none;
+    }}
+    QScrollArea > QWidget > QWidget {{
+        background-color: {VSCODE_COLORS['background']};
+    }}
+    QLabel#recentName {{
+        color: {VSCODE_COLORS['accent']};
+        background: transparent;
+    }}
+    QLabel#recentDetail {{
+        color: {VSCODE_COLORS['text_secondary']};
+        background: transparent;
+    }}
+"""
+
+_LINK_BUTTON_QSS = f"""
+    QPushButton {{
+        background: transparent;
+        border: none;
+        color: {VSCODE_COLORS['accent']};
+        text-align: left;
+        padding: 6px 0px;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        color: {VSCODE_COLORS['accent_hover']};
+        text-decoration: underline;
+    }}
+"""
+
+
+def _tight_vbox(parent: QWidget, spacing: int = 0) -> QVBoxLayout:
+    """创建无边距的垂直布局（先设置边距和间距，再安装到父控件）"""
+    layout = QVBoxLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(spacing)
+    parent.setLayout(layout)
+    return layout
+
+
+def _tight_hbox(parent: QWidget, spacing: int = 0) -> QHBoxLayout:
+    """创建无边距的水平布局（先设置边距和间距，再安装到父控件）"""
+    layout = QHBoxLayout()
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(spacing)
+    parent.setLayout(layout)
+    return layout
 
 
 class RecentWorkspaceItem(QWidget):
@@ -23,10 +90,12 @@ class RecentWorkspaceItem(QWidget):
     
     clicked = pyqtSignal(str)  # workspace_id
     
-    def __init__(self, info: WorkspaceInfo, parent=None):
+    def __init__(self, info: Optional[WorkspaceInfo] = None, parent=None):
         super().__init__(parent)
-        self.workspace_id = info.id
-        self.workspace_name = info.name
+        self.workspace_id = ""
+        self.workspace_name = ""
+        self._hovered = False
+        self.setObjectName("recentItem")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         layout = QHBoxLayout(self)
@@ -35,46 +104,57 @@ class RecentWorkspaceItem(QWidget):
         
         # 图标
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon("folder").pixmap(20, 20))
+        icon_label.setPixmap(get_pixmap("folder", size=20))
         layout.addWidget(icon_label)
         
         # 文字区域
         text_widget = QWidget()
-        text_layout = QVBoxLayout(text_widget)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(2)
+        text_layout = _tight_vbox(text_widget, 2)
         
         # 名称
-        name_label = QLabel(info.name)
-        name_label.setFont(QFont("Segoe UI", 10))
-        name_label.setStyleSheet(f"color: {VSCODE_COLORS['accent']};")
-        text_layout.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("recentName")
+        self.name_label.setFont(_FONT_NAME)
+        text_layout.addWidget(self.name_label)
         
         # 详情
-        try:
-            dt = datetime.fromisoformat(info.last_modified)
-            time_str = dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            time_str = ""
-        
-        if time_str:
-            detail_text = f"{info.file_count} 个文件 · {time_str}"
-            detail_label = QLabel(detail_text)
-            detail_label.setFont(QFont("Segoe UI", 9))
-            detail_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']};")
-            text_layout.addWidget(detail_label)
+        self.detail_label = QLabel()
+        self.detail_label.setObjectName("recentDetail")
+        self.detail_label.setFont(_FONT_DETAIL)
+        text_layout.addWidget(self.detail_label)
         
         layout.addWidget(text_widget, 1)
         
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: transparent;
-                border-radius: 4px;
-            }}
-            QWidget:hover {{
-                background-color: {VSCODE_COLORS['hover']};
-            }}
-        """)
+        if info is not None:
+            self.update_info(info)
+    
+    def update_info(self, info: WorkspaceInfo):
+        """就地更新显示的工作区信息（复用控件，不重建）"""
+        self.workspace_id = info.id
+        self.workspace_name = info.name
+        self.name_label.setText(info.name)
+        
+        time_str = info.last_modified_display
+        if time_str:
+            self.detail_label.setText(f"{info.file_count} 个文件 · {time_str}")
+        self.detail_label.setVisible(bool(time_str))
+    
+    def set_hovered(self, hovered: bool):
+        """设置悬停状态（由 WelcomePage 的事件过滤器统一驱动）"""
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.update()
+    
+    def paintEvent(self, event):
+        # 直接绘制悬停背景，避免 QSS :hover 在每次进出时重新 polish
+        if self._hovered:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(_HOVER_COLOR)
+            painter.drawRoundedRect(self.rect(), 4, 4)
+            painter.end()
+        super().paintEvent(event)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -85,6 +165,9 @@ class RecentWorkspaceItem(QWidget):
 class WelcomePage(QWidget):
     """欢迎页"""
     
+    # 最多显示的最近工作区数量
+    MAX_RECENT = 5
+    
     # 信号
     open_file_requested = pyqtSignal()
     new_workspace_requested = pyqtSignal()
@@ -94,15 +177,24 @@ class WelcomePage(QWidget):
         super().__init__(parent)
         self.workspace_manager = workspace_manager
         self.setObjectName("welcomePage")
-        self._setup_ui()
+        self._content_built = False
+        self._last_recent_sig: Optional[tuple] = None
+        self._setup_stub()
     
-    def _setup_ui(self):
-        """设置UI"""
-        # 主布局
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
+    def _setup_stub(self):
+        """只创建主布局和样式，页面内容推迟到首次显示时构建"""
+        self._main_layout = _tight_vbox(self)
+        self.setStyleSheet(_WELCOME_QSS)
+    
+    def showEvent(self, event):
+        if not self._content_built:
+            self._setup_content()
+            self._content_built = True
+            self.refresh_recent_workspaces()
+        super().showEvent(event)
+    
+    def _setup_content(self):
+        """构建页面内容"""
         # 滚动区域
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -117,41 +209,28 @@ class WelcomePage(QWidget):
         
         # 标题区域
         title_widget = QWidget()
-        title_layout = QVBoxLayout(title_widget)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        title_layout.setSpacing(8)
+        title_layout = _tight_vbox(title_widget, 8)
         
         # 主标题
         title_label = QLabel("CSV Analyzer")
-        title_label.setFont(QFont("Segoe UI", 28, QFont.Weight.Light))
-        title_label.setStyleSheet(f"color: {VSCODE_COLORS['foreground']};")
+        title_label.setFont(_FONT_TITLE)
+        title_label.setStyleSheet(_PRIMARY_TEXT_QSS)
         title_layout.addWidget(title_label)
         
         # 副标题
         subtitle_label = QLabel("大体积CSV文件查看与分析工具")
-        subtitle_label.setFont(QFont("Segoe UI", 12))
-        subtitle_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']};")
+        subtitle_label.setFont(_FONT_SUBTITLE)
+        subtitle_label.setStyleSheet(_SECONDARY_TEXT_QSS)
         title_layout.addWidget(subtitle_label)
         
         content_layout.addWidget(title_widget)
         
         # 两列布局
         columns_widget = QWidget()
-        columns_layout = QHBoxLayout(columns_widget)
-        columns_layout.setContentsMargins(0, 0, 0, 0)
-        columns_layout.setSpacing(60)
+        columns_layout = _tight_hbox(columns_widget, 60)
         
         # 左列：开始
-        left_column = QWidget()
-        left_layout = QVBoxLayout(left_column)
-        left_layout.setContentsMargins(0, 0, 0, 0)
-        left_layout.setSpacing(16)
-        left_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        start_label = QLabel("开始")
-        start_label.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
-        start_label.setStyleSheet(f"color: {VSCODE_COLORS['foreground']};")
-        left_layout.addWidget(start_label)
+        left_column, left_layout = self._make_column("开始")
         
         # 新建工作区按钮
         new_ws_btn = self._create_link_button("新建工作区", "add")
@@ -167,22 +246,27 @@ class WelcomePage(QWidget):
         columns_layout.addWidget(left_column)
         
         # 右列：最近
-        right_column = QWidget()
-        right_layout = QVBoxLayout(right_column)
-        right_layout.setContentsMargins(0, 0, 0, 0)
-        right_layout.setSpacing(16)
-        right_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        recent_label = QLabel("最近")
-        recent_label.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
-        recent_label.setStyleSheet(f"color: {VSCODE_COLORS['foreground']};")
-        right_layout.addWidget(recent_label)
+        right_column, right_layout = self._make_column("最近")
         
         # 最近工作区列表
         self.recent_list = QWidget()
-        self.recent_list_layout = QVBoxLayout(self.recent_list)
-        self.recent_list_layout.setContentsMargins(0, 0, 0, 0)
-        self.recent_list_layout.setSpacing(4)
+        self.recent_list_layout = _tight_vbox(self.recent_list, 4)
+        
+        # 预先创建固定数量的列表项，刷新时就地更新
+        self._empty_label = QLabel("暂无最近工作区")
+        self._empty_label.setStyleSheet(_EMPTY_HINT_QSS)
+        self._empty_label.hide()
+        self.recent_list_layout.addWidget(self._empty_label)
+        
+        self._recent_items: List[RecentWorkspaceItem] = []
+        for _ in range(self.MAX_RECENT):
+            item = RecentWorkspaceItem()
+            item.clicked.connect(self.workspace_selected.emit)
+            item.installEventFilter(self)
+            item.hide()
+            self.recent_list_layout.addWidget(item)
+            self._recent_items.append(item)
+        
         right_layout.addWidget(self.recent_list)
         
         right_layout.addStretch()
@@ -196,65 +280,64 @@ class WelcomePage(QWidget):
         content_layout.addStretch()
         
         scroll.setWidget(content)
-        main_layout.addWidget(scroll)
-        
-        # 样式
-        self.setStyleSheet(f"""
-            QWidget#welcomePage {{
-                background-color: {VSCODE_COLORS['background']};
-            }}
-            QScrollArea {{
-                background-color: {VSCODE_COLORS['background']};
-                border: none;
-            }}
-            QScrollArea > QWidget > QWidget {{
-                background-color: {VSCODE_COLORS['background']};
-            }}
-        """)
-        
-        # 加载最近工作区
-        self.refresh_recent_workspaces()
+        self._main_layout.addWidget(scroll)
+    
+    def eventFilter(self, obj, event):
+        """统一处理最近工作区项的悬停"""
+        if isinstance(obj, RecentWorkspaceItem):
+            event_type = event.type()
+            if event_type == QEvent.Type.Enter:
+                obj.set_hovered(True)
+            elif event_type in (QEvent.Type.Leave, QEvent.Type.Hide):
+                obj.set_hovered(False)
+        return super().eventFilter(obj, event)
+    
+    def _make_column(self, title: str) -> Tuple[QWidget, QVBoxLayout]:
+        """创建带标题的内容列，返回 (列控件, 列布局)"""
+        column = QWidget()
+        layout = _tight_vbox(column, 16)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        
+        title_label = QLabel(title)
+        title_label.setFont(_FONT_SECTION)
+        title_label.setStyleSheet(_PRIMARY_TEXT_QSS)
+        layout.addWidget(title_label)
+        return column, layout
     
     def _create_link_button(self, text: str, icon_name: str) -> QPushButton:
         """创建链接样式按钮"""
         btn = QPushButton(text)
         btn.setIcon(get_icon(icon_name))
         btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                color: {VSCODE_COLORS['accent']};
-                text-align: left;
-                padding: 6px 0px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                color: {VSCODE_COLORS['accent_hover']};
-                text-decoration: underline;
-            }}
-        """)
+        btn.setStyleSheet(_LINK_BUTTON_QSS)
         return btn
     
     def refresh_recent_workspaces(self):
         """刷新最近工作区列表"""
-        # 清空现有列表
-        while self.recent_list_layout.count():
-            item = self.recent_list_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        if not self._content_built:
+            # 内容尚未构建，首次显示时会刷新
+            return
         
         # 获取最近工作区
-        workspaces = self.workspace_manager.get_recent_workspaces()
+        workspaces = self.workspace_manager.get_recent_workspaces(limit=self.MAX_RECENT)
         
-        if not workspaces:
-            empty_label = QLabel("暂无最近工作区")
-            empty_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']}; padding: 8px 0;")
-            self.recent_list_layout.addWidget(empty_label)
+        # 列表未变化时不触碰控件
+        signature = tuple((w.id, w.name, w.last_modified, w.file_count) for w in workspaces)
+        if signature == self._last_recent_sig:
             return
+        self._last_recent_sig = signature
         
-        # 只显示前5个
-        for info in workspaces[:5]:
-            item = RecentWorkspaceItem(info)
-            item.clicked.connect(self.workspace_selected.emit)
-            self.recent_list_layout.addWidget(item)
+        # 批量更新期间暂停重绘，结束后统一刷新一次
+        self.recent_list.setUpdatesEnabled(False)
+        try:
+            self._empty_label.setVisible(not workspaces)
+            
+            # 复用已有列表项，多余的隐藏
+            for i, item in enumerate(self._recent_items):
+                if i < len(workspaces):
+                    item.update_info(workspaces[i])
+                    item.show()
+                else:
+                    item.hide()
+        finally:
+            self.recent_list.setUpdatesEnabled(True)
@@ -2,86 +2,282 @@
 工作区选择对话框 - 启动时选择或创建工作区
 """
 
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QLineEdit, QWidget, QFrame,
-    QMessageBox, QInputDialog, QSizePolicy, QAbstractItemView
+    QListView, QLineEdit, QFrame, QApplication, QStyle,
+    QMessageBox, QInputDialog, QSizePolicy, QAbstractItemView,
+    QStyledItemDelegate, QStyleOptionViewItem, QToolTip
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSize, QRect, QPoint, QEvent, QTimer,
+    QAbstractListModel, QModelIndex, QPersistentModelIndex
+)
+from PyQt6.QtGui import QFont, QIcon, QPainter, QColor
 
 from csv_analyzer.core.workspace import WorkspaceManager, WorkspaceInfo, WorkspaceConfig
 from csv_analyzer.frontend.styles.theme import VSCODE_COLORS
-from csv_analyzer.frontend.styles.icons import get_icon
+from csv_analyzer.frontend.styles.icons import get_icon, get_pixmap
+
+
+# 共享字体（QFont 为隐式共享，多个控件复用同一实例是安全的）
+_FONT_NAME = QFont("Segoe UI", 11)
+_FONT_DETAIL = QFont("Segoe UI", 9)
+_FONT_TITLE = QFont("Segoe UI", 20, QFont.Weight.Bold)
+_FONT_SUBTITLE = QFont("Segoe UI", 11)
+
+
+# 样式表（主题确定后不再变化，模块加载时生成一次）
+_SECONDARY_TEXT_QSS = f"color: {VSCODE_COLORS['text_secondary']};"
+
+_PICKER_QSS = f"""
+    QDialog {{
+        background-color: {VSCODE_COLORS['background']};
+    }}
+    QLabel {{
+        color: {VSCODE_COLORS['foreground']};
+    }}
+    QPushButton {{
+        background-color: {VSCODE_COLORS['button_bg']};
+        color: {VSCODE_COLORS['foreground']};
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {VSCODE_COLORS['button_hover']};
+    }}
+    QPushButton:pressed {{
+        background-color: {VSCODE_COLORS['selection']};
+    }}
+    QPushButton#primaryButton {{
+        background-color: {VSCODE_COLORS['accent']};
+    }}
+    QPushButton#primaryButton:hover {{
+        background-color: {VSCODE_COLORS['accent_hover']};
+    }}
+    QLineEdit {{
+        background-color: {VSCODE_COLORS['input_bg']};
+        color: {VSCODE_COLORS['foreground']};
+        border: 1px solid {VSCODE_COLORS['border']};
+        border-radius: 4px;
+        padding: 8px 12px;
+        font-size: 12px;
+    }}
+    QLineEdit:focus {{
+        border-color: {VSCODE_COLORS['input_focus_border']};
+    }}
+    QListView {{
+        background-color: {VSCODE_COLORS['sidebar_bg']};
+        border: 1px solid {VSCODE_COLORS['border']};
+        border-radius: 6px;
+        outline: none;
+    }}
+    QListView::item {{
+        border: none;
+        border-radius: 4px;
+        margin: 2px 4px;
+    }}
+    QListView::item:hover {{
+        background-color: {VSCODE_COLORS['hover']};
+    }}
+    QListView::item:selected {{
+        background-color: {VSCODE_COLORS['selection']};
+    }}
+"""
 
 
-class WorkspaceListItem(QWidget):
-    """工作区列表项"""
+class WorkspaceListModel(QAbstractListModel):
+    """工作区列表模型"""
+    
+    DetailRole = Qt.ItemDataRole.UserRole + 1  # 详情文本
+    
+    PLACEHOLDER_TEXT = "没有找到工作区，点击 \"新建工作区\" 开始"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._workspaces: List[WorkspaceInfo] = []
+    
+    def set_workspaces(self, workspaces: List[WorkspaceInfo]):
+        """设置工作区列表"""
+        self.beginResetModel()
+        self._workspaces = list(workspaces)
+        self.endResetModel()
+    
+    def is_empty(self) -> bool:
+        """是否没有工作区（此时显示一行占位提示）"""
+        return not self._workspaces
+    
+    def find_row(self, workspace_id: str) -> int:
+        """查找工作区所在行，找不到返回 -1"""
+        for row, info in enumerate(self._workspaces):
+            if info.id == workspace_id:
+                return row
+        return -1
+    
+    def removeRows(self, row: int, count: int, parent=QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._workspaces):
+            return False
+        
+        if count == len(self._workspaces):
+            # 全部删除后切换为占位行，行数不变，直接重置
+            self.beginResetModel()
+            self._workspaces.clear()
+            self.endResetModel()
+            return True
+        
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._workspaces[row:row + count]
+        self.endRemoveRows()
+        return True
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        # 没有工作区时保留一行占位提示
+        return len(self._workspaces) or 1
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid() or self.is_empty():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if self.is_empty():
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.PLACEHOLDER_TEXT
+            return None
+        
+        row = index.row()
+        if row < 0 or row >= len(self._workspaces):
+            return None
+        info = self._workspaces[row]
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return info.name
+        if role == Qt.ItemDataRole.UserRole:
+            return info.id
+        if role == self.DetailRole:
+            time_str = info.last_modified_display or info.last_modified
+            return f"{info.file_count} 个文件 · 上次使用: {time_str}"
+        if role == Qt.ItemDataRole.DecorationRole:
+            return get_icon("folder")
+        return None
+
+
+class WorkspaceDelegate(QStyledItemDelegate):
+    """工作区列表项绘制（图标 + 名称 + 详情 + 删除按钮），不为每行创建控件"""
     
     delete_clicked = pyqtSignal(str)  # workspace_id
     
-    def __init__(self, info: WorkspaceInfo, parent=None):
+    ROW_HEIGHT = 60
+    ICON_SIZE = 24
+    DELETE_SIZE = 24
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.workspace_id = info.id
-        self.workspace_name = info.name
+        self._hover_pos: Optional[QPoint] = None
+        self._hover_index = QPersistentModelIndex()  # 上次悬停的行，离开时需重绘以清除按钮高亮
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(0, self.ROW_HEIGHT)
+    
+    def _delete_rect(self, rect: QRect) -> QRect:
+        """删除按钮区域"""
+        return QRect(
+            rect.right() - 12 - self.DELETE_SIZE,
+            rect.center().y() - self.DELETE_SIZE // 2,
+            self.DELETE_SIZE, self.DELETE_SIZE
+        )
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        painter.save()
+        
+        # 背景（悬停/选中样式由对话框样式表决定）
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        rect = option.rect
+        workspace_id = index.data(Qt.ItemDataRole.UserRole)
         
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
+        # 占位提示
+        if not workspace_id:
+            painter.setPen(QColor(VSCODE_COLORS['text_secondary']))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data(Qt.ItemDataRole.DisplayRole) or "")
+            painter.restore()
+            return
         
         # 图标
-        icon_label = QLabel()
-        icon_label.setPixmap(get_icon("folder").pixmap(24, 24))
-        layout.addWidget(icon_label)
+        icon_top = rect.center().y() - self.ICON_SIZE // 2
+        painter.drawPixmap(rect.left() + 12, icon_top, get_pixmap("folder", size=self.ICON_SIZE))
         
         # 文字区域
-        text_widget = QWidget()
-        text_layout = QVBoxLayout(text_widget)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(2)
-        
-        # 名称
-        name_label = QLabel(info.name)
-        name_label.setFont(QFont("Segoe UI", 11))
-        name_label.setStyleSheet(f"color: {VSCODE_COLORS['foreground']};")
-        text_layout.addWidget(name_label)
-        
-        # 详情
-        try:
-            dt = datetime.fromisoformat(info.last_modified)
-            time_str = dt.strftime("%Y-%m-%d %H:%M")
-        except:
-            time_str = info.last_modified
+        delete_rect = self._delete_rect(rect)
+        text_left = rect.left() + 12 + self.ICON_SIZE + 12
+        text_width = delete_rect.left() - 12 - text_left
         
-        detail_text = f"{info.file_count} 个文件 · 上次使用: {time_str}"
-        detail_label = QLabel(detail_text)
-        detail_label.setFont(QFont("Segoe UI", 9))
-        detail_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']};")
-        text_layout.addWidget(detail_label)
+        name_rect = QRect(text_left, rect.top() + 10, text_width, rect.height() // 2 - 10)
+        painter.setFont(_FONT_NAME)
+        painter.setPen(QColor(VSCODE_COLORS['foreground']))
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+                         painter.fontMetrics().elidedText(index.data(Qt.ItemDataRole.DisplayRole) or "",
+                                                          Qt.TextElideMode.ElideRight, text_width))
         
-        layout.addWidget(text_widget, 1)
+        detail_rect = QRect(text_left, rect.top() + rect.height() // 2 + 2, text_width, rect.height() // 2 - 10)
+        painter.setFont(_FONT_DETAIL)
+        painter.setPen(QColor(VSCODE_COLORS['text_secondary']))
+        painter.drawText(detail_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                         painter.fontMetrics().elidedText(index.data(WorkspaceListModel.DetailRole) or "",
+                                                          Qt.TextElideMode.ElideRight, text_width))
         
         # 删除按钮
-        delete_btn = QPushButton()
-        delete_btn.setIcon(get_icon("clear"))
-        delete_btn.setFixedSize(24, 24)
-        delete_btn.setToolTip("删除工作区")
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: transparent;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {VSCODE_COLORS['error']};
-            }}
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self.workspace_id))
-        layout.addWidget(delete_btn)
+        if self._hover_pos is not None and delete_rect.contains(self._hover_pos):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(VSCODE_COLORS['error']))
+            painter.drawRoundedRect(delete_rect, 4, 4)
+        clear_rect = delete_rect.adjusted(4, 4, -4, -4)
+        painter.drawPixmap(clear_rect.topLeft(), get_pixmap("clear", size=clear_rect.width()))
+        
+        painter.restore()
+    
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """处理删除按钮的悬停与点击"""
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseMove:
+            self._hover_pos = event.position().toPoint()
+            view = option.widget
+            if view is not None:
+                # option.rect 为视口坐标，需在 viewport 上重绘；悬停行变化时同时重绘上一行
+                viewport = view.viewport()
+                previous = self._hover_index
+                if previous.isValid() and previous != QPersistentModelIndex(index):
+                    viewport.update(view.visualRect(QModelIndex(previous)))
+                viewport.update(option.rect)
+            self._hover_index = QPersistentModelIndex(index)
+        elif event_type == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            workspace_id = index.data(Qt.ItemDataRole.UserRole)
+            if workspace_id and self._delete_rect(option.rect).contains(event.position().toPoint()):
+                self.delete_clicked.emit(workspace_id)
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event, view, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """删除按钮提示"""
+        if index.data(Qt.ItemDataRole.UserRole) and self._delete_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "删除工作区", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+    
+    def clear_hover(self):
+        """鼠标离开列表时清除悬停状态"""
+        self._hover_pos = None
+        self._hover_index = QPersistentModelIndex()
 
 
 class WorkspacePickerDialog(QDialog):
@@ -95,6 +291,10 @@ class WorkspacePickerDialog(QDialog):
         self.workspace_manager = workspace_manager
         self.selected_workspace_id: Optional[str] = None
         
+        # 工作区元数据缓存（对话框打开期间只读盘一次，搜索在内存中过滤）
+        self._recent_workspaces: Optional[List[WorkspaceInfo]] = None
+        self._all_workspaces: Optional[List[Tuple[str, WorkspaceInfo]]] = None
+        
         self._setup_ui()
         self._load_workspaces()
     
@@ -106,62 +306,7 @@ class WorkspacePickerDialog(QDialog):
         self.setModal(True)
         
         # 样式
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {VSCODE_COLORS['background']};
-            }}
-            QLabel {{
-                color: {VSCODE_COLORS['foreground']};
-            }}
-            QPushButton {{
-                background-color: {VSCODE_COLORS['button_bg']};
-                color: {VSCODE_COLORS['foreground']};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: {VSCODE_COLORS['button_hover']};
-            }}
-            QPushButton:pressed {{
-                background-color: {VSCODE_COLORS['selection']};
-            }}
-            QPushButton#primaryButton {{
-                background-color: {VSCODE_COLORS['accent']};
-            }}
-            QPushButton#primaryButton:hover {{
-                background-color: {VSCODE_COLORS['accent_hover']};
-            }}
-            QLineEdit {{
-                background-color: {VSCODE_COLORS['input_bg']};
-                color: {VSCODE_COLORS['foreground']};
-                border: 1px solid {VSCODE_COLORS['border']};
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }}
-            QLineEdit:focus {{
-                border-color: {VSCODE_COLORS['input_focus_border']};
-            }}
-            QListWidget {{
-                background-color: {VSCODE_COLORS['sidebar_bg']};
-                border: 1px solid {VSCODE_COLORS['border']};
-                border-radius: 6px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                border: none;
-                border-radius: 4px;
-                margin: 2px 4px;
-            }}
-            QListWidget::item:hover {{
-                background-color: {VSCODE_COLORS['hover']};
-            }}
-            QListWidget::item:selected {{
-                background-color: {VSCODE_COLORS['selection']};
-            }}
-        """)
+        self.setStyleSheet(_PICKER_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -169,14 +314,14 @@ class WorkspacePickerDialog(QDialog):
         
         # 标题
         title_label = QLabel("欢迎使用 CSV Analyzer")
-        title_label.setFont(QFont("Segoe UI", 20, QFont.Weight.Bold))
+        title_label.setFont(_FONT_TITLE)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # 副标题
         subtitle_label = QLabel("选择一个工作区继续，或创建新的工作区")
-        subtitle_label.setFont(QFont("Segoe UI", 11))
-        subtitle_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']};")
+        subtitle_label.setFont(_FONT_SUBTITLE)
+        subtitle_label.setStyleSheet(_SECONDARY_TEXT_QSS)
         subtitle_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(subtitle_label)
         
@@ -188,11 +333,27 @@ class WorkspacePickerDialog(QDialog):
         self.search_input.textChanged.connect(self._on_search)
         layout.addWidget(self.search_input)
         
-        # 工作区列表
-        self.workspace_list = QListWidget()
+        # 输入停顿后再搜索，避免每次按键都重新加载
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(lambda: self._load_workspaces(self.search_input.text()))
+        
+        # 工作区列表（模型 + 委托绘制，不为每行创建控件）
+        self.workspace_model = WorkspaceListModel(self)
+        self.workspace_delegate = WorkspaceDelegate(self)
+        self.workspace_delegate.delete_clicked.connect(self._on_delete_workspace)
+        
+        self.workspace_list = QListView()
+        self.workspace_list.setModel(self.workspace_model)
+        self.workspace_list.setItemDelegate(self.workspace_delegate)
+        # 所有行高度一致（包括占位行），滚动范围无需逐行计算
+        self.workspace_list.setUniformItemSizes(True)
+        self.workspace_list.setMouseTracking(True)
+        self.workspace_list.viewport().installEventFilter(self)
         self.workspace_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.workspace_list.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.workspace_list.itemSelectionChanged.connect(self._on_selection_changed)
+        self.workspace_list.doubleClicked.connect(self._on_item_double_clicked)
+        self.workspace_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
         layout.addWidget(self.workspace_list, 1)
         
         # 按钮区域
@@ -226,51 +387,62 @@ class WorkspacePickerDialog(QDialog):
     
     def _load_workspaces(self, query: str = ""):
         """加载工作区列表"""
-        self.workspace_list.clear()
-        
+        query = query.lower().strip()
         if query:
-            workspaces = self.workspace_manager.search_workspaces(query)
+            workspaces = [info for name, info in self._get_all_workspaces() if query in name]
         else:
-            workspaces = self.workspace_manager.get_recent_workspaces()
+            if self._recent_workspaces is None:
+                self._recent_workspaces = self.workspace_manager.get_recent_workspaces()
+            workspaces = self._recent_workspaces
             if not workspaces:
-                workspaces = self.workspace_manager.list_workspaces()
-        
-        for info in workspaces:
-            item = QListWidgetItem(self.workspace_list)
-            item.setData(Qt.ItemDataRole.UserRole, info.id)
-            item.setSizeHint(QSize(0, 60))
-            
-            widget = WorkspaceListItem(info)
-            widget.delete_clicked.connect(self._on_delete_workspace)
-            
-            self.workspace_list.setItemWidget(item, widget)
-        
-        # 如果没有工作区，显示提示
-        if not workspaces:
-            item = QListWidgetItem("没有找到工作区，点击 \"新建工作区\" 开始")
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            self.workspace_list.addItem(item)
+                workspaces = [info for _, info in self._get_all_workspaces()]
+        
+        # 重置期间暂停重绘并屏蔽选择信号，结束后统一刷新一次
+        selection_model = self.workspace_list.selectionModel()
+        self.workspace_list.setUpdatesEnabled(False)
+        selection_model.blockSignals(True)
+        try:
+            # 没有工作区时模型显示一行占位提示
+            self.workspace_model.set_workspaces(workspaces)
+        finally:
+            selection_model.blockSignals(False)
+            self.workspace_list.setUpdatesEnabled(True)
+        self._on_selection_changed()
+    
+    def _get_all_workspaces(self) -> List[Tuple[str, WorkspaceInfo]]:
+        """所有工作区 (小写名称, 信息)，首次使用时加载"""
+        if self._all_workspaces is None:
+            self._all_workspaces = [
+                (info.name.lower(), info) for info in self.workspace_manager.list_workspaces()
+            ]
+        return self._all_workspaces
+    
+    def eventFilter(self, obj, event):
+        """鼠标离开列表时清除删除按钮的悬停效果"""
+        if obj is self.workspace_list.viewport() and event.type() == QEvent.Type.Leave:
+            self.workspace_delegate.clear_hover()
+            self.workspace_list.viewport().update()
+        return super().eventFilter(obj, event)
     
     def _on_search(self, text: str):
         """搜索工作区"""
-        self._load_workspaces(text)
+        self._search_timer.start()
     
     def _on_selection_changed(self):
         """选择改变"""
-        selected = self.workspace_list.selectedItems()
+        selected = self.workspace_list.selectionModel().selectedIndexes()
         self.open_btn.setEnabled(bool(selected))
     
-    def _on_item_double_clicked(self, item: QListWidgetItem):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """双击打开工作区"""
-        workspace_id = item.data(Qt.ItemDataRole.UserRole)
+        workspace_id = index.data(Qt.ItemDataRole.UserRole)
         if workspace_id:
             self.selected_workspace_id = workspace_id
             self.accept()
     
     def _on_open(self):
         """打开选中的工作区"""
-        selected = self.workspace_list.selectedItems()
+        selected = self.workspace_list.selectionModel().selectedIndexes()
         if selected:
             workspace_id = selected[0].data(Qt.ItemDataRole.UserRole)
             if workspace_id:
@@ -299,7 +471,16 @@ class WorkspacePickerDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.workspace_manager.delete_workspace(workspace_id)
-            self._load_workspaces(self.search_input.text())
+            if self._recent_workspaces is not None:
+                self._recent_workspaces = [w for w in self._recent_workspaces if w.id != workspace_id]
+            if self._all_workspaces is not None:
+                self._all_workspaces = [e for e in self._all_workspaces if e[1].id != workspace_id]
+            # 只移除对应行，不重新加载整个列表
+            row = self.workspace_model.find_row(workspace_id)
+            if row >= 0:
+                self.workspace_model.removeRow(row)
+            self.workspace_delegate.clear_hover()
+            self._on_selection_changed()
     
     def get_selected_workspace_id(self) -> Optional[str]:
         """获取选中的工作区ID"""
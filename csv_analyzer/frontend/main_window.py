@@ -3,9 +3,13 @@
 采用VSCode风格的布局
 """
 
+import csv
+import math
 import os
 import platform
-from typing import Optional, Dict, Any, List
+import weakref
+from collections import Counter, OrderedDict
+from typing import Optional, Dict, Any, List, Iterable
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
@@ -14,35 +18,351 @@ from PyQt6.QtWidgets import (
     QApplication, QToolButton, QFrame, QLineEdit, QCompleter,
     QListWidget, QListWidgetItem, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, QPoint, QEvent, QRect, QStringListModel
-from PyQt6.QtGui import QAction, QKeySequence, QIcon, QPainter, QColor, QPen, QShortcut
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSize, QPoint, QEvent, QStringListModel, QSortFilterProxyModel
+from PyQt6.QtGui import QAction, QKeySequence, QIcon, QPainter, QPainterPath, QColor, QPen
 
 from csv_analyzer.core.ipc import IPCClient, MessageType
 from csv_analyzer.core.workspace import WorkspaceManager, WorkspaceConfig, WorkspaceInfo
-from csv_analyzer.frontend.styles.theme import get_main_stylesheet, VSCODE_COLORS
-from csv_analyzer.frontend.styles.icons import get_icon
+from csv_analyzer.frontend.styles.theme import get_main_stylesheet, C
+from csv_analyzer.frontend.styles.icons import get_icon, get_pixmap
 from csv_analyzer.frontend.components.sidebar import SidebarWidget
 from csv_analyzer.frontend.components.data_table import DataTableWidget
 from csv_analyzer.frontend.components.sql_editor import SQLEditorWidget
 from csv_analyzer.frontend.components.cell_inspector import CellInspectorWidget
 
 
+# 样式表（主题确定后不再变化，模块加载时生成一次）
+_SECONDARY_TEXT_QSS = f"color: {C.text_secondary};"
+
+_COLUMN_SEARCH_PLACEHOLDER = "输入 表名.列名 或列名..."
+
+_COLUMN_SEARCH_INPUT_QSS = f"""
+    QLineEdit {{
+        background-color: {C.input_bg};
+        color: {C.foreground};
+        border: 1px solid {C.border};
+        border-radius: 4px;
+        padding: 4px 8px;
+    }}
+    QLineEdit:focus {{
+        border-color: {C.input_focus_border};
+    }}
+"""
+
+_CLOSE_SEARCH_BTN_QSS = f"""
+    QToolButton {{
+        background: transparent;
+        border: none;
+    }}
+    QToolButton:hover {{
+        background-color: {C.hover};
+        border-radius: 4px;
+    }}
+"""
+
+_COLUMN_SEARCH_BAR_QSS = f"""
+    QWidget {{
+        background-color: {C.sidebar_bg};
+        border-bottom: 1px solid {C.border};
+    }}
+"""
+
+
+def _build_mac_toolbar_qss(top_radius: str) -> str:
+    """macOS 工具栏样式（top_radius 为顶栏圆角）"""
+    return f"""
+        QToolBar {{
+            background-color: {C.titlebar_bg};
+            border: none;
+            spacing: 2px;
+            padding: 0px 4px;
+            min-height: 28px;
+            max-height: 28px;
+            border-top-left-radius: {top_radius};
+            border-top-right-radius: {top_radius};
+        }}
+        QToolButton {{
+            padding: 2px 4px;
+            border-radius: 4px;
+            background-color: transparent;
+        }}
+        QToolButton:hover {{
+            background-color: {C.hover};
+        }}
+        /* macOS红绿灯按钮 - 透明背景，无底色 */
+        QWidget#macTrafficControls {{
+            background-color: transparent;
+        }}
+        QToolButton#macTrafficClose,
+        QToolButton#macTrafficMin,
+        QToolButton#macTrafficZoom {{
+            border: none;
+            border-radius: 6px;
+            padding: 0px;
+            min-width: 12px;
+            max-width: 12px;
+            min-height: 12px;
+            max-height: 12px;
+            background-color: transparent;
+        }}
+        QToolButton#macTrafficClose {{ background-color: #ff5f57; }}
+        QToolButton#macTrafficMin {{ background-color: #febc2e; }}
+        QToolButton#macTrafficZoom {{ background-color: #28c840; }}
+        /* 悬停时显示图标 */
+        QToolButton#macTrafficClose:hover {{ background-color: #ff5f57; }}
+        QToolButton#macTrafficMin:hover {{ background-color: #febc2e; }}
+        QToolButton#macTrafficZoom:hover {{ background-color: #28c840; }}
+        QToolButton#windowClose:hover {{
+            background-color: {C.error};
+        }}
+        QToolButton#windowClose:pressed {{
+            background-color: {C.error};
+        }}
+        QToolButton:checked {{
+            background-color: {C.selection};
+        }}
+    """
+
+
+_TOOLBAR_QSS_MAC_FRAMELESS = _build_mac_toolbar_qss(C.window_radius)
+_TOOLBAR_QSS_MAC = _build_mac_toolbar_qss('0px')
+
+_TOOLBAR_QSS_DEFAULT = f"""
+    QToolBar {{
+        background-color: {C.titlebar_bg};
+        border: none;
+        spacing: 2px;
+        padding: 0px 4px;
+        min-height: 28px;
+        max-height: 28px;
+    }}
+    QToolButton {{
+        padding: 2px 4px;
+        border-radius: 4px;
+        background-color: transparent;
+    }}
+    QToolButton:hover {{
+        background-color: {C.hover};
+    }}
+    QToolButton#windowClose:hover {{
+        background-color: {C.error};
+    }}
+    QToolButton#windowClose:pressed {{
+        background-color: {C.error};
+    }}
+    QToolButton:checked {{
+        background-color: {C.selection};
+    }}
+"""
+
+_WORKSPACE_SEARCH_CONTAINER_QSS = f"""
+    QWidget#workspaceSearchContainer {{
+        background-color: {C.titlebar_bg};
+    }}
+"""
+
+_WORKSPACE_SEARCH_INPUT_QSS = f"""
+    QLineEdit#workspaceSearch {{
+        background-color: transparent;
+        color: {C.foreground};
+        font-size: 10px;
+        padding: 0;
+        border: none;
+    }}
+"""
+
+_WORKSPACE_SEARCH_BOX_QSS = f"""
+    QWidget#workspaceSearchBox {{
+        background-color: {C.titlebar_bg};
+        border: 1px solid gray;
+        border-radius: 4px;
+    }}
+    QWidget#workspaceSearchBox:focus-within {{
+        border-color: {C.input_focus_border};
+        background-color: {C.titlebar_bg};
+    }}
+"""
+
+_WORKSPACE_POPUP_QSS = f"""
+    QListWidget {{
+        background-color: {C.dropdown_bg};
+        border: 1px solid {C.border};
+        border-radius: 6px;
+        padding: 4px;
+        outline: none;
+    }}
+    QListWidget::item {{
+        padding: 8px 12px;
+        border-radius: 4px;
+        color: {C.foreground};
+    }}
+    QListWidget::item:hover {{
+        background-color: {C.hover};
+    }}
+    QListWidget::item:selected {{
+        background-color: {C.selection};
+    }}
+"""
+
+
+# 无边框缩放的边缘位掩码（取值与 Qt.Edge 相同，可直接转换）
+_EDGE_TOP = 0x1
+_EDGE_LEFT = 0x2
+_EDGE_RIGHT = 0x4
+_EDGE_BOTTOM = 0x8
+
+
+def _build_edge_cursors() -> tuple:
+    """以边缘位掩码为下标的光标形状表（None 表示恢复默认光标）"""
+    table = []
+    for edges in range(16):
+        if edges in (_EDGE_LEFT | _EDGE_TOP, _EDGE_RIGHT | _EDGE_BOTTOM):
+            table.append(Qt.CursorShape.SizeFDiagCursor)
+        elif edges in (_EDGE_RIGHT | _EDGE_TOP, _EDGE_LEFT | _EDGE_BOTTOM):
+            table.append(Qt.CursorShape.SizeBDiagCursor)
+        elif edges & (_EDGE_LEFT | _EDGE_RIGHT):
+            table.append(Qt.CursorShape.SizeHorCursor)
+        elif edges & (_EDGE_TOP | _EDGE_BOTTOM):
+            table.append(Qt.CursorShape.SizeVerCursor)
+        else:
+            table.append(None)
+    return tuple(table)
+
+
+_EDGE_CURSORS = _build_edge_cursors()
+
+# CSV 导出：写文件缓冲区大小与视图导出的最大行数
+_EXPORT_BUFFER_SIZE = 1 << 20
+_EXPORT_MAX_ROWS = 1_000_000
+
+# 列分析结果缓存的最大条目数
+_COLUMN_ANALYSIS_CACHE_SIZE = 128
+
+# 每个表格控件最多保留的预取页数
+_PREFETCH_MAX_PAGES = 2
+
+# 工作区下拉最多显示的条目数
+_WORKSPACE_POPUP_MAX_ITEMS = 8
+
+# 全局事件过滤器关心的鼠标事件类型
+_MOUSE_EVENT_TYPES = frozenset((
+    QEvent.Type.MouseMove,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseButtonRelease,
+))
+# 全局事件过滤器需要处理的全部事件类型（另含工作区搜索框的键盘/焦点事件）
+_FILTER_EVENT_TYPES = _MOUSE_EVENT_TYPES | frozenset((
+    QEvent.Type.KeyPress,
+    QEvent.Type.FocusIn,
+    QEvent.Type.FocusOut,
+))
+
+
+# 菜单定义：(菜单标题, 菜单项)
+# 菜单项为 (文本, 快捷键, 槽函数名)、(子菜单标题, 子菜单项) 或 None（分隔线）
+_RECENT_FILES_MENU = object()  # 占位：最近打开的文件子菜单
+
+_MENU_SPEC = (
+    ("文件(&F)", (
+        ("打开CSV文件(&O)...", QKeySequence.StandardKey.Open, "_on_open_file"),
+        _RECENT_FILES_MENU,
+        None,
+        ("工作区(&W)", (
+            ("新建工作区(&N)...", None, "_create_new_workspace"),
+            ("切换工作区(&S)...", None, "_show_workspace_picker"),
+            None,
+            ("重命名工作区(&R)...", None, "_rename_current_workspace"),
+        )),
+        None,
+        ("保存工作区(&S)", "Ctrl+S", "_save_workspace_async"),
+        None,
+        ("导出结果(&E)...", "Ctrl+Shift+E", "_on_export"),
+        None,
+        ("退出(&X)", QKeySequence.StandardKey.Quit, "close"),
+    )),
+    ("编辑(&E)", (
+        ("跳转到列(&F)...", QKeySequence.StandardKey.Find, "_show_column_search"),
+    )),
+    ("视图(&V)", (
+        ("切换侧边栏", "Ctrl+B", "_toggle_sidebar"),
+        ("切换检查器面板", "Ctrl+Shift+I", "_toggle_inspector"),
+        ("切换SQL编辑器", "Ctrl+`", "_toggle_sql_editor"),
+    )),
+    ("查询(&Q)", (
+        ("执行查询(&R)", "F5", "_on_execute_sql"),
+        None,
+        ("保存为视图(&S)...", "Ctrl+Shift+S", "_on_save_view"),
+    )),
+    ("帮助(&H)", (
+        ("关于(&A)", None, "_show_about"),
+    )),
+)
+
+
+class _TrafficGroup(QObject):
+    """红绿灯按钮组，广播整组悬停状态（避免每次悬停遍历子控件）"""
+    
+    hover_changed = pyqtSignal(bool)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buttons: List['MacTrafficButton'] = []
+
+
 class MacTrafficButton(QToolButton):
     """macOS风格的红绿灯按钮，悬停时显示功能图标"""
     
-    def __init__(self, button_type: str, parent=None):
+    # 按钮底色
+    _COLORS = {
+        'close': '#ff5f57',
+        'minimize': '#febc2e',
+        'zoom': '#28c840',
+    }
+    # 悬停图标颜色
+    _ICON_COLORS = {
+        'close': '#4a0000',
+        'minimize': '#5a3d00',
+        'zoom': '#0a4a0a',
+    }
+    # 悬停图标线段：close 为 X，minimize 为 -，zoom 为 +
+    _ICON_SEGMENTS = {
+        'close': ((3, 3, 9, 9), (9, 3, 3, 9)),
+        'minimize': ((3, 6, 9, 6),),
+        'zoom': ((3, 6, 9, 6), (6, 3, 6, 9)),
+    }
+    # 按类型缓存的图标路径（所有按钮实例共享）
+    _icon_paths: Dict[str, QPainterPath] = {}
+    
+    @classmethod
+    def _icon_path(cls, button_type: str) -> Optional[QPainterPath]:
+        """获取图标路径，首次使用时由线段构建"""
+        path = cls._icon_paths.get(button_type)
+        if path is None:
+            segments = cls._ICON_SEGMENTS.get(button_type)
+            if not segments:
+                return None
+            path = QPainterPath()
+            for x1, y1, x2, y2 in segments:
+                path.moveTo(x1, y1)
+                path.lineTo(x2, y2)
+            cls._icon_paths[button_type] = path
+        return path
+    
+    def __init__(self, button_type: str, group: Optional[_TrafficGroup] = None, parent=None):
         super().__init__(parent)
         self._button_type = button_type  # 'close', 'minimize', 'zoom'
         self._hovered = False
         self._group_hovered = False  # 整组按钮是否被悬停
+        self._group = group
+        if group is not None:
+            group.buttons.append(self)
+            group.hover_changed.connect(self.set_group_hovered)
         
-        # 颜色配置
-        self._colors = {
-            'close': '#ff5f57',
-            'minimize': '#febc2e', 
-            'zoom': '#28c840'
-        }
-        self._inactive_color = '#4a4a4a'
+        # 预先创建绘制用的颜色、画笔和图标路径，绘制时不再重复构造
+        self._brush_color = QColor(self._COLORS.get(button_type, '#666666'))
+        self._icon_pen = QPen(QColor(self._ICON_COLORS.get(button_type, '#0a4a0a')))
+        self._icon_pen.setWidth(2)
+        self._icon_path_cached = self._icon_path(button_type)
         
         self.setFixedSize(12, 12)
         self.setMouseTracking(True)
@@ -55,21 +375,19 @@ class MacTrafficButton(QToolButton):
     
     def enterEvent(self, event):
         self._hovered = True
-        # 通知其他按钮整组被悬停
-        parent = self.parent()
-        if parent:
-            for child in parent.findChildren(MacTrafficButton):
-                child.set_group_hovered(True)
-        self.update()
+        # 通知整组按钮被悬停
+        if self._group is not None:
+            self._group.hover_changed.emit(True)
+        else:
+            self.set_group_hovered(True)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         self._hovered = False
-        parent = self.parent()
-        if parent:
-            for child in parent.findChildren(MacTrafficButton):
-                child.set_group_hovered(False)
-        self.update()
+        if self._group is not None:
+            self._group.hover_changed.emit(False)
+        else:
+            self.set_group_hovered(False)
         super().leaveEvent(event)
     
     def paintEvent(self, event):
@@ -77,50 +395,44 @@ class MacTrafficButton(QToolButton):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 绘制圆形背景
-        color = QColor(self._colors.get(self._button_type, '#666666'))
-        painter.setBrush(color)
+        painter.setBrush(self._brush_color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(0, 0, 12, 12)
         
         # 悬停时绘制功能图标
-        if self._group_hovered:
-            pen = QPen(QColor('#4a0000' if self._button_type == 'close' else '#5a3d00' if self._button_type == 'minimize' else '#0a4a0a'))
-            pen.setWidth(2)
-            painter.setPen(pen)
-            
-            if self._button_type == 'close':
-                # X 图标
-                painter.drawLine(3, 3, 9, 9)
-                painter.drawLine(9, 3, 3, 9)
-            elif self._button_type == 'minimize':
-                # - 图标
-                painter.drawLine(3, 6, 9, 6)
-            elif self._button_type == 'zoom':
-                # + 图标 (或对角箭头)
-                painter.drawLine(3, 6, 9, 6)
-                painter.drawLine(6, 3, 6, 9)
+        if self._group_hovered and self._icon_path_cached is not None:
+            painter.setPen(self._icon_pen)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPath(self._icon_path_cached)
         
         painter.end()
 
 
-class AsyncWorker(QThread):
-    """异步工作线程"""
+class _AsyncSignals(QObject):
+    """异步任务的信号（QRunnable 本身不能发信号）"""
     
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
+
+
+class _AsyncTask(QRunnable):
+    """在全局线程池中执行的异步任务"""
     
     def __init__(self, func, *args, **kwargs):
         super().__init__()
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.signals = _AsyncSignals()
+        # 由 MainWindow 持有引用直到结果送达，避免信号对象提前销毁
+        self.setAutoDelete(False)
     
     def run(self):
         try:
             result = self.func(*self.args, **self.kwargs)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class _WindowDragArea(QWidget):
@@ -135,6 +447,13 @@ class _WindowDragArea(QWidget):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
+            # 优先交给系统处理拖拽（Qt 6.2+），不必每次移动都回调 Python
+            if not self._window.isMaximized():
+                handle = self._window.windowHandle()
+                if handle is not None and handle.startSystemMove():
+                    event.accept()
+                    return
+            # 回退：手动跟踪偏移（最大化时需先还原再移动）
             self._dragging = True
             try:
                 self._drag_offset = event.globalPosition().toPoint() - self._window.frameGeometry().topLeft()
@@ -148,15 +467,16 @@ class _WindowDragArea(QWidget):
         if self._dragging and (event.buttons() & Qt.MouseButton.LeftButton):
             if self._window.isMaximized():
                 # 从最大化状态拖拽时，先还原再移动（保持鼠标相对位置）
+                # 图标由 MainWindow.changeEvent 同步；移动推迟到还原完成后的下一轮事件循环，
+                # 避免同一事件内连续两次几何变更
                 try:
                     global_pos = event.globalPosition().toPoint()
                     ratio_x = max(0.0, min(1.0, event.position().x() / max(1.0, float(self.width()))))
                     self._window.showNormal()
-                    if hasattr(self._window, "_sync_max_restore_icon"):
-                        self._window._sync_max_restore_icon()
                     new_offset_x = int(self._window.width() * ratio_x)
                     self._drag_offset = QPoint(new_offset_x, int(event.position().y()))
-                    self._window.move(global_pos - self._drag_offset)
+                    target = global_pos - self._drag_offset
+                    QTimer.singleShot(0, lambda: self._window.move(target))
                 except Exception:
                     pass
                 event.accept()
@@ -186,6 +506,63 @@ class _WindowDragArea(QWidget):
         return super().mouseDoubleClickEvent(event)
 
 
+def _analyze_column_values(column_data: list) -> dict:
+    """本地计算列统计信息（单次遍历同时统计缺失值、取值频次与数值）"""
+    total_rows = len(column_data)
+    missing_count = 0
+    value_counts = Counter()
+    numeric_values = []
+    append_numeric = numeric_values.append
+    for v in column_data:
+        if v is None:
+            missing_count += 1
+            continue
+        text = str(v)
+        if text == 'NULL' or text == '':
+            missing_count += 1
+            continue
+        value_counts[text] += 1
+        try:
+            append_numeric(float(v))
+        except (ValueError, TypeError):
+            pass
+    
+    non_null_count = total_rows - missing_count
+    missing_pct = (missing_count / total_rows * 100) if total_rows > 0 else 0
+    is_numeric = len(numeric_values) > non_null_count * 0.5
+    
+    analysis = {
+        'dtype': 'numeric' if is_numeric else 'text',
+        'total_rows': total_rows,
+        'unique_count': len(value_counts),
+        'missing_count': missing_count,
+        'missing_percentage': missing_pct,
+        'is_numeric': is_numeric,
+    }
+    
+    # 数值统计 - 使用 numeric_stats 字典格式（只排序一次，min/max/中位数/四分位均取自有序序列）
+    if is_numeric and numeric_values:
+        sorted_vals = sorted(numeric_values)
+        n = len(sorted_vals)
+        mid = n // 2
+        mean = math.fsum(sorted_vals) / n
+        numeric_stats = {
+            'min': sorted_vals[0],
+            'max': sorted_vals[-1],
+            'mean': mean,
+            'median': sorted_vals[mid] if n % 2 else (sorted_vals[mid - 1] + sorted_vals[mid]) / 2,
+        }
+        if n > 1:
+            numeric_stats['std'] = math.sqrt(math.fsum((x - mean) ** 2 for x in sorted_vals) / (n - 1))
+            numeric_stats['q1'] = sorted_vals[n // 4]
+            numeric_stats['q3'] = sorted_vals[3 * n // 4]
+        analysis['numeric_stats'] = numeric_stats
+    
+    # Top值统计 - 使用元组列表格式 [(value, count), ...]
+    analysis['top_values'] = value_counts.most_common(10)
+    return analysis
+
+
 class MainWindow(QMainWindow):
     """主窗口"""
     
@@ -207,27 +584,90 @@ class MainWindow(QMainWindow):
         
         # 工作区修改标记
         self._workspace_dirty: bool = False
+        self._dirty_serial = 0  # 每次标记修改递增，用于判断保存期间是否又有修改
+        self._save_in_flight = False
         self._last_saved_state: Optional[str] = None  # 用于比较状态
         
         # 工作区名称到ID的映射
         self._workspace_name_to_id: Dict[str, str] = {}
+        # 工作区内存索引（创建/重命名/切换后重建），搜索时不再读取磁盘
+        self._recent_workspace_list: Optional[list] = None
+        self._workspace_index: List[tuple] = []  # [(小写名称, WorkspaceInfo)]
+        self._last_popup_query: Optional[str] = None  # 下拉当前显示结果对应的查询
         
         # 当前状态
         self._current_table: Optional[str] = None
-        self._workers: list = []
+        self._workers: set = set()
         self._loaded_files: List[str] = []
         self._shutting_down: bool = False
         
         # 表名到文件路径的映射
         self._table_to_file: Dict[str, str] = {}
+        # 列分析结果缓存：("table", 表名, 列名) 或 ("sql", SQL, 列名) -> 分析数据（LRU）
+        self._column_analysis_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        # 单元格选中后的列分析防抖：快速移动光标时只分析最后停留的列
+        self._pending_analysis: Optional[tuple] = None
+        self._last_analysis_key: Optional[tuple] = None  # 列分析面板当前显示的 (表名, SQL, 列名)
+        self._analysis_timer = QTimer(self)
+        self._analysis_timer.setSingleShot(True)
+        self._analysis_timer.setInterval(150)
+        self._analysis_timer.timeout.connect(self._fire_pending_analysis)
+        # SQL补全用的表结构缓存：表或视图变化后置脏，由 get_tables 的结果（含刷新表列表时的结果）更新
+        self._sql_tables_dirty = True
+        self._sql_tables_fetching = False
+        self._sql_tables_gen = 0  # 每次失效递增，丢弃失效前发出的请求结果
+        # 分页预取：表格控件 -> (已预取的页 {(表名或SQL, offset, limit): 数据}, 进行中的预取键集合)
+        self._page_caches: "weakref.WeakKeyDictionary[DataTableWidget, tuple]" = weakref.WeakKeyDictionary()
+        # 工作区加载过程中的状态（由 _load_workspace_async 设置）
+        self._workspace_config: Optional[WorkspaceConfig] = None
 
         # 无边框窗口 + 自定义窗口控制
         self._frameless_enabled = True
         self._resize_margin = 6
         self._resizing = False
-        self._resize_edges: set[str] = set()
-        self._resize_start_global = QPoint()
-        self._resize_start_geo = QRect()
+        self._resize_edges: int = 0  # _EDGE_* 位掩码
+        self._current_cursor_shape: Optional[Qt.CursorShape] = None  # 当前缩放光标，避免重复 setCursor/unsetCursor
+        # 手动缩放起点：(鼠标全局 x, y, 窗口 x, y, 宽, 高, 最小宽, 最小高)
+        self._resize_start: tuple = (0, 0, 0, 0, 0, 0, 0, 0)
+        self._applied_resize_geo: Optional[tuple] = None  # 最近一次应用的 (x, y, w, h)
+        # 窗口尺寸缓存（在 resizeEvent 中更新），命中测试时免去 width()/height()/rect() 调用
+        self._cached_w = 0
+        self._cached_h = 0
+        # 边缘光标更新节流（鼠标移动事件频率远高于屏幕刷新率），记录全局坐标
+        self._pending_cursor_pos: Optional[QPoint] = None
+        self._cursor_throttle = QTimer(self)
+        self._cursor_throttle.setSingleShot(True)
+        self._cursor_throttle.setInterval(16)
+        self._cursor_throttle.timeout.connect(self._flush_resize_cursor)
+        
+        # 在 _setup_* 中创建的控件，预先置空以便直接读取（无需 getattr）
+        self._win_btn_min: Optional[QToolButton] = None
+        self._win_btn_max: Optional[QToolButton] = None
+        self._win_btn_close: Optional[QToolButton] = None
+        self._mac_btn_close: Optional[MacTrafficButton] = None
+        self._mac_btn_min: Optional[MacTrafficButton] = None
+        self._mac_btn_zoom: Optional[MacTrafficButton] = None
+        self.workspace_search: Optional[QLineEdit] = None
+        self.workspace_search_box: Optional[QWidget] = None
+        self.workspace_popup: Optional[QListWidget] = None
+        # 搜索框左下角的全局坐标缓存（窗口移动/缩放后失效）
+        self._search_box_anchor: Optional[QPoint] = None
+        # 最大化按钮图标同步状态
+        self._icon_sync_pending = False
+        self._max_icon_is_restore: Optional[bool] = None
+        # 全局事件过滤器是否已安装（仅在需要边缘缩放或下拉可见时安装）
+        self._app_filter_installed = False
+        # 手动缩放时的几何更新节流（每次 setGeometry 都会触发整窗重新布局）
+        self._pending_resize_pos: Optional[QPoint] = None
+        self._resize_throttle = QTimer(self)
+        self._resize_throttle.setSingleShot(True)
+        self._resize_throttle.setInterval(16)
+        self._resize_throttle.timeout.connect(self._flush_resize)
+        # 工作区搜索防抖：连续输入时合并为一次搜索与下拉刷新
+        self._search_debounce_timer = QTimer(self)
+        self._search_debounce_timer.setSingleShot(True)
+        self._search_debounce_timer.setInterval(50)
+        self._search_debounce_timer.timeout.connect(self._do_workspace_search)
         
         self._setup_ui()
         self._setup_menu()
@@ -236,47 +676,25 @@ class MainWindow(QMainWindow):
         self._connect_signals()
 
         # 捕获全局鼠标事件：用于无边框边缘缩放（鼠标事件大多会落在子控件上）
-        app = QApplication.instance()
-        if app is not None:
-            app.installEventFilter(self)
-        
-        # 设置快捷键
-        self._setup_shortcuts()
+        self._sync_app_event_filter()
         
         # 延迟启动后端和加载工作区，确保界面先显示
         QTimer.singleShot(100, self._delayed_init)
     
     def _delayed_init(self):
         """延迟初始化 - 在界面显示后启动后端和加载工作区"""
-        # 启动后端（异步）
-        def start_backend_async():
-            try:
-                self.ipc_client.start()
-                return True
-            except Exception as e:
-                return str(e)
-        
-        def on_backend_started(result):
-            if result is True:
-                self.backend_status.setText("后端：运行中")
-                self._show_status("后端服务已启动")
-                # 后端启动成功后，延迟加载工作区
-                QTimer.singleShot(200, self._load_workspace_async)
-            else:
-                self.backend_status.setText("后端：启动失败")
-                QMessageBox.critical(self, "错误", f"后端启动失败: {result}")
+        # 启动后端（在线程池中执行，异常经 error 信号返回）
+        def on_backend_started(_result):
+            self.backend_status.setText("后端：运行中")
+            self._show_status("后端服务已启动")
+            # 后端启动成功后，延迟加载工作区
+            QTimer.singleShot(200, self._load_workspace_async)
         
-        self._run_async(start_backend_async, on_backend_started)
-    
-    def _setup_shortcuts(self):
-        """设置快捷键"""
-        # Cmd+F / Ctrl+F 打开列搜索
-        find_shortcut = QShortcut(QKeySequence.StandardKey.Find, self)
-        find_shortcut.activated.connect(self._show_column_search)
+        def on_backend_failed(error: str):
+            self.backend_status.setText("后端：启动失败")
+            QMessageBox.critical(self, "错误", f"后端启动失败: {error}")
         
-        # Esc 关闭列搜索
-        esc_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-        esc_shortcut.activated.connect(self._hide_column_search)
+        self._run_async(self.ipc_client.start, on_backend_started, on_backend_failed)
     
     def _setup_ui(self):
         """设置UI"""
@@ -319,6 +737,9 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
+        # 构建期间暂停重绘，全部添加完成后统一布局一次
+        self.setUpdatesEnabled(False)
+        
         # 主分割器
         self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
         self.main_splitter.setChildrenCollapsible(False)  # 防止子控件被完全折叠
@@ -350,16 +771,12 @@ class MainWindow(QMainWindow):
         self.data_tabs.tabBar().setExpanding(False)
         data_container_layout.addWidget(self.data_tabs)
         
-        # 欢迎页（在数据区域显示）
-        from csv_analyzer.frontend.components.welcome_page import WelcomePage
-        self.welcome_page = WelcomePage(self.workspace_manager)
-        self.welcome_page.open_file_requested.connect(self._on_open_file)
-        self.welcome_page.new_workspace_requested.connect(lambda: self._create_new_workspace())
-        self.welcome_page.workspace_selected.connect(self._switch_to_workspace)
+        # 欢迎页（在数据区域显示，需要时才创建）
+        self.welcome_page = None
         
         # 如果需要显示欢迎页，添加为初始Tab
         if self._show_welcome:
-            self.data_tabs.addTab(self.welcome_page, "欢迎")
+            self.data_tabs.addTab(self._ensure_welcome_page(), "欢迎")
         
         # 列搜索栏（默认隐藏，按Cmd+F/Ctrl+F显示）
         self.column_search_bar = QWidget()
@@ -371,28 +788,28 @@ class MainWindow(QMainWindow):
         search_bar_layout.addStretch()  # 靠右显示
         
         search_label = QLabel("跳转到列:")
-        search_label.setStyleSheet(f"color: {VSCODE_COLORS['text_secondary']};")
+        search_label.setStyleSheet(_SECONDARY_TEXT_QSS)
         search_bar_layout.addWidget(search_label)
         
         self.column_search_input = QLineEdit()
-        self.column_search_input.setPlaceholderText("输入 表名.列名 或列名...")
+        self.column_search_input.setPlaceholderText(_COLUMN_SEARCH_PLACEHOLDER)
         self.column_search_input.setFixedWidth(250)
         self.column_search_input.returnPressed.connect(self._on_column_search_enter)
-        self.column_search_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {VSCODE_COLORS['input_bg']};
-                color: {VSCODE_COLORS['foreground']};
-                border: 1px solid {VSCODE_COLORS['border']};
-                border-radius: 4px;
-                padding: 4px 8px;
-            }}
-            QLineEdit:focus {{
-                border-color: {VSCODE_COLORS['input_focus_border']};
-            }}
-        """)
+        self.column_search_input.setStyleSheet(_COLUMN_SEARCH_INPUT_QSS)
         
         # 列搜索自动补全
-        self.column_completer = QCompleter()
+        # 持久的源模型 + 排序代理，列变化时只更新源模型
+        self._column_src_model = QStringListModel(self)
+        self._column_proxy_model = QSortFilterProxyModel(self)
+        self._column_proxy_model.setSourceModel(self._column_src_model)
+        self._column_proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._column_proxy_model.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._column_proxy_model.sort(0)
+        self._last_completer_columns: List[str] = []
+        # 侧边栏表列表变化后才需要重新收集列名
+        self._column_completer_dirty = True
+        
+        self.column_completer = QCompleter(self._column_proxy_model, self)
         self.column_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.column_completer.setFilterMode(Qt.MatchFlag.MatchContains)
         self.column_search_input.setCompleter(self.column_completer)
@@ -406,24 +823,17 @@ class MainWindow(QMainWindow):
         close_search_btn.setFixedSize(20, 20)
         close_search_btn.setToolTip("关闭搜索栏 (Esc)")
         close_search_btn.clicked.connect(self._hide_column_search)
-        close_search_btn.setStyleSheet(f"""
-            QToolButton {{
-                background: transparent;
-                border: none;
-            }}
-            QToolButton:hover {{
-                background-color: {VSCODE_COLORS['hover']};
-                border-radius: 4px;
-            }}
-        """)
+        
+        # Esc 关闭列搜索：挂在搜索栏上，只在搜索栏可见且有焦点时生效
+        esc_action = QAction(self.column_search_bar)
+        esc_action.setShortcut(QKeySequence(Qt.Key.Key_Escape))
+        esc_action.setShortcutContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        esc_action.triggered.connect(self._hide_column_search)
+        self.column_search_bar.addAction(esc_action)
+        close_search_btn.setStyleSheet(_CLOSE_SEARCH_BTN_QSS)
         search_bar_layout.addWidget(close_search_btn)
         
-        self.column_search_bar.setStyleSheet(f"""
-            QWidget {{
-                background-color: {VSCODE_COLORS['sidebar_bg']};
-                border-bottom: 1px solid {VSCODE_COLORS['border']};
-            }}
-        """)
+        self.column_search_bar.setStyleSheet(_COLUMN_SEARCH_BAR_QSS)
         data_container_layout.addWidget(self.column_search_bar)
         
         # 中间垂直分割器
@@ -458,6 +868,7 @@ class MainWindow(QMainWindow):
         
         layout.addWidget(self.main_splitter)
         main_layout.addWidget(content_widget)
+        self.setUpdatesEnabled(True)
     
     def _setup_menu(self):
         """设置菜单栏"""
@@ -468,104 +879,44 @@ class MainWindow(QMainWindow):
         if is_windows:
             menubar.setVisible(False)
         
-        # 文件菜单
-        file_menu = menubar.addMenu("文件(&F)")
-        
-        open_action = QAction("打开CSV文件(&O)...", self)
-        open_action.setShortcut(QKeySequence.StandardKey.Open)
-        open_action.triggered.connect(self._on_open_file)
-        file_menu.addAction(open_action)
-        
-        # 最近打开的文件
-        self.recent_menu = file_menu.addMenu("最近打开(&R)")
-        self._update_recent_menu()
-        
-        file_menu.addSeparator()
-        
-        # 工作区菜单
-        workspace_menu = file_menu.addMenu("工作区(&W)")
-        
-        new_workspace_action = QAction("新建工作区(&N)...", self)
-        new_workspace_action.triggered.connect(lambda: self._create_new_workspace())
-        workspace_menu.addAction(new_workspace_action)
-        
-        switch_workspace_action = QAction("切换工作区(&S)...", self)
-        switch_workspace_action.triggered.connect(self._show_workspace_picker)
-        workspace_menu.addAction(switch_workspace_action)
-        
-        workspace_menu.addSeparator()
-        
-        rename_workspace_action = QAction("重命名工作区(&R)...", self)
-        rename_workspace_action.triggered.connect(self._rename_current_workspace)
-        workspace_menu.addAction(rename_workspace_action)
-        
-        file_menu.addSeparator()
-        
-        save_workspace_action = QAction("保存工作区(&S)", self)
-        save_workspace_action.setShortcut(QKeySequence("Ctrl+S"))
-        save_workspace_action.triggered.connect(self._save_workspace)
-        file_menu.addAction(save_workspace_action)
-        
-        file_menu.addSeparator()
-        
-        export_action = QAction("导出结果(&E)...", self)
-        export_action.setShortcut(QKeySequence("Ctrl+Shift+E"))
-        export_action.triggered.connect(self._on_export)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("退出(&X)", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # 编辑菜单
-        edit_menu = menubar.addMenu("编辑(&E)")
-        
-        # 视图菜单
-        view_menu = menubar.addMenu("视图(&V)")
-        
-        toggle_sidebar = QAction("切换侧边栏", self)
-        toggle_sidebar.setShortcut(QKeySequence("Ctrl+B"))
-        toggle_sidebar.triggered.connect(self._toggle_sidebar)
-        view_menu.addAction(toggle_sidebar)
-        
-        toggle_inspector = QAction("切换检查器面板", self)
-        toggle_inspector.setShortcut(QKeySequence("Ctrl+Shift+I"))
-        toggle_inspector.triggered.connect(self._toggle_inspector)
-        view_menu.addAction(toggle_inspector)
-        
-        toggle_sql = QAction("切换SQL编辑器", self)
-        toggle_sql.setShortcut(QKeySequence("Ctrl+`"))
-        toggle_sql.triggered.connect(self._toggle_sql_editor)
-        view_menu.addAction(toggle_sql)
-        
-        # 查询菜单
-        query_menu = menubar.addMenu("查询(&Q)")
-        
-        run_query = QAction("执行查询(&R)", self)
-        run_query.setShortcut(QKeySequence("F5"))
-        run_query.triggered.connect(self._on_execute_sql)
-        query_menu.addAction(run_query)
-        
-        query_menu.addSeparator()
-        
-        save_view = QAction("保存为视图(&S)...", self)
-        save_view.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        save_view.triggered.connect(self._on_save_view)
-        query_menu.addAction(save_view) # type: ignore
-        
-        # 帮助菜单
-        help_menu = menubar.addMenu("帮助(&H)")
-        
-        about_action = QAction("关于(&A)", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        # 构建期间屏蔽菜单栏信号
+        self._menu_actions: Dict[str, QAction] = {}
+        menubar.blockSignals(True)
+        for title, items in _MENU_SPEC:
+            self._build_menu(menubar.addMenu(title), items)
+        menubar.blockSignals(False)
+        
+        # Cmd+F / Ctrl+F 打开列搜索：同时挂到窗口上，菜单栏隐藏时快捷键仍然有效
+        self.addAction(self._menu_actions["_show_column_search"])
+    
+    def _build_menu(self, menu: QMenu, items):
+        """按 _MENU_SPEC 描述填充菜单"""
+        for item in items:
+            if item is None:
+                menu.addSeparator()
+            elif item is _RECENT_FILES_MENU:
+                # 最近打开的文件（内容动态更新）
+                self.recent_menu = menu.addMenu("最近打开(&R)")
+                self._update_recent_menu()
+            elif isinstance(item[1], tuple):
+                # 子菜单
+                self._build_menu(menu.addMenu(item[0]), item[1])
+            else:
+                text, shortcut, slot_name = item
+                action = QAction(text, self)
+                if shortcut is not None:
+                    action.setShortcut(QKeySequence(shortcut))
+                # 忽略 triggered 的 checked 参数，避免被当作槽函数的第一个参数
+                slot = getattr(self, slot_name)
+                action.triggered.connect(lambda _checked=False, slot=slot: slot())
+                menu.addAction(action)
+                self._menu_actions[slot_name] = action
     
     def _setup_toolbar(self):
         """设置工具栏"""
         toolbar = QToolBar()
+        # 逐个添加按钮时不触发中间的布局/重绘
+        toolbar.setUpdatesEnabled(False)
         toolbar.setMovable(False)
         is_macos = platform.system() == 'Darwin'
         toolbar.setIconSize(QSize(20, 20) if is_macos else QSize(20, 20))
@@ -574,87 +925,9 @@ class MainWindow(QMainWindow):
         if is_macos:
             toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
             # 添加圆角到顶栏（适配无边框窗口）
-            top_radius = VSCODE_COLORS.get('window_radius', '10px') if self._frameless_enabled else '0px'
-            toolbar.setStyleSheet(f"""
-                QToolBar {{
-                    background-color: {VSCODE_COLORS['titlebar_bg']};
-                    border: none;
-                    spacing: 2px;
-                    padding: 0px 4px;
-                    min-height: 28px;
-                    max-height: 28px;
-                    border-top-left-radius: {top_radius};
-                    border-top-right-radius: {top_radius};
-                }}
-                QToolButton {{
-                    padding: 2px 4px;
-                    border-radius: 4px;
-                    background-color: transparent;
-                }}
-                QToolButton:hover {{
-                    background-color: {VSCODE_COLORS['hover']};
-                }}
-                /* macOS红绿灯按钮 - 透明背景，无底色 */
-                QWidget#macTrafficControls {{
-                    background-color: transparent;
-                }}
-                QToolButton#macTrafficClose,
-                QToolButton#macTrafficMin,
-                QToolButton#macTrafficZoom {{
-                    border: none;
-                    border-radius: 6px;
-                    padding: 0px;
-                    min-width: 12px;
-                    max-width: 12px;
-                    min-height: 12px;
-                    max-height: 12px;
-                    background-color: transparent;
-                }}
-                QToolButton#macTrafficClose {{ background-color: #ff5f57; }}
-                QToolButton#macTrafficMin {{ background-color: #febc2e; }}
-                QToolButton#macTrafficZoom {{ background-color: #28c840; }}
-                /* 悬停时显示图标 */
-                QToolButton#macTrafficClose:hover {{ background-color: #ff5f57; }}
-                QToolButton#macTrafficMin:hover {{ background-color: #febc2e; }}
-                QToolButton#macTrafficZoom:hover {{ background-color: #28c840; }}
-                QToolButton#windowClose:hover {{
-                    background-color: {VSCODE_COLORS['error']};
-                }}
-                QToolButton#windowClose:pressed {{
-                    background-color: {VSCODE_COLORS['error']};
-                }}
-                QToolButton:checked {{
-                    background-color: {VSCODE_COLORS['selection']};
-                }}
-            """)
+            toolbar.setStyleSheet(_TOOLBAR_QSS_MAC_FRAMELESS if self._frameless_enabled else _TOOLBAR_QSS_MAC)
         else:
-            toolbar.setStyleSheet(f"""
-                QToolBar {{
-                    background-color: {VSCODE_COLORS['titlebar_bg']};
-                    border: none;
-                    spacing: 2px;
-                    padding: 0px 4px;
-                    min-height: 28px;
-                    max-height: 28px;
-                }}
-                QToolButton {{
-                    padding: 2px 4px;
-                    border-radius: 4px;
-                    background-color: transparent;
-                }}
-                QToolButton:hover {{
-                    background-color: {VSCODE_COLORS['hover']};
-                }}
-                QToolButton#windowClose:hover {{
-                    background-color: {VSCODE_COLORS['error']};
-                }}
-                QToolButton#windowClose:pressed {{
-                    background-color: {VSCODE_COLORS['error']};
-                }}
-                QToolButton:checked {{
-                    background-color: {VSCODE_COLORS['selection']};
-                }}
-            """)
+            toolbar.setStyleSheet(_TOOLBAR_QSS_DEFAULT)
 
         # macOS：左侧红绿灯（无边框模式下自绘，悬停显示功能图标）
         if self._frameless_enabled and is_macos:
@@ -663,18 +936,20 @@ class MainWindow(QMainWindow):
             mac_layout = QHBoxLayout(mac_controls)
             mac_layout.setContentsMargins(8, 0, 8, 0)
             mac_layout.setSpacing(8)
+            mac_controls.traffic_group = _TrafficGroup(mac_controls)
+            group = mac_controls.traffic_group
 
-            self._mac_btn_close = MacTrafficButton('close')
+            self._mac_btn_close = MacTrafficButton('close', group)
             self._mac_btn_close.setToolTip("关闭")
             self._mac_btn_close.clicked.connect(self.close)
             mac_layout.addWidget(self._mac_btn_close)
 
-            self._mac_btn_min = MacTrafficButton('minimize')
+            self._mac_btn_min = MacTrafficButton('minimize', group)
             self._mac_btn_min.setToolTip("最小化")
             self._mac_btn_min.clicked.connect(self.showMinimized)
             mac_layout.addWidget(self._mac_btn_min)
 
-            self._mac_btn_zoom = MacTrafficButton('zoom')
+            self._mac_btn_zoom = MacTrafficButton('zoom', group)
             self._mac_btn_zoom.setToolTip("最大化/还原")
             self._mac_btn_zoom.clicked.connect(self._toggle_max_restore)
             mac_layout.addWidget(self._mac_btn_zoom)
@@ -690,7 +965,7 @@ class MainWindow(QMainWindow):
         # 保存工作区
         save_workspace_btn = QAction(get_icon("save"), "保存工作区", self)
         save_workspace_btn.setToolTip("保存当前工作区 (Ctrl+S)")
-        save_workspace_btn.triggered.connect(self._save_workspace)
+        save_workspace_btn.triggered.connect(self._save_workspace_async)
         toolbar.addAction(save_workspace_btn)
         
         toolbar.addSeparator()
@@ -761,6 +1036,9 @@ class MainWindow(QMainWindow):
             self._win_btn_max = QToolButton()
             self._win_btn_max.setObjectName("windowMax")
             self._win_btn_max.setToolTip("最大化/还原")
+            # 预先取好两种状态的图标，窗口状态变化时直接切换
+            self._icon_max = get_icon("window_maximize")
+            self._icon_restore = get_icon("window_restore")
             self._win_btn_max.clicked.connect(self._toggle_max_restore)
             toolbar.addWidget(self._win_btn_max)
 
@@ -771,8 +1049,9 @@ class MainWindow(QMainWindow):
             self._win_btn_close.clicked.connect(self.close)
             toolbar.addWidget(self._win_btn_close)
 
-            self._sync_max_restore_icon()
+            self._do_sync_max_restore_icon()
         
+        toolbar.setUpdatesEnabled(True)
         self.addToolBar(toolbar)
 
     def _toggle_max_restore(self):
@@ -784,24 +1063,74 @@ class MainWindow(QMainWindow):
         self._sync_max_restore_icon()
 
     def _sync_max_restore_icon(self):
-        """同步最大化按钮图标"""
-        if not getattr(self, "_frameless_enabled", False):
+        """同步最大化按钮图标（合并同一轮事件循环内的多次状态变化）"""
+        if self._icon_sync_pending:
+            return
+        self._icon_sync_pending = True
+        QTimer.singleShot(0, self._do_sync_max_restore_icon)
+
+    def _do_sync_max_restore_icon(self):
+        """按当前窗口状态设置最大化按钮图标"""
+        self._icon_sync_pending = False
+        if not self._frameless_enabled:
             return
-        btn = getattr(self, "_win_btn_max", None)
+        btn = self._win_btn_max
         if btn is None:
             return
-        btn.setIcon(get_icon("window_restore" if self.isMaximized() else "window_maximize"))
+        maximized = self.isMaximized()
+        if maximized != self._max_icon_is_restore:
+            self._max_icon_is_restore = maximized
+            btn.setIcon(self._icon_restore if maximized else self._icon_max)
+
+    def resizeEvent(self, event):
+        size = event.size()
+        self._cached_w = size.width()
+        self._cached_h = size.height()
+        self._search_box_anchor = None
+        super().resizeEvent(event)
+
+    def moveEvent(self, event):
+        self._search_box_anchor = None
+        super().moveEvent(event)
 
     def changeEvent(self, event):
         if event.type() == QEvent.Type.WindowStateChange:
             self._sync_max_restore_icon()
+            self._sync_app_event_filter()
         return super().changeEvent(event)
 
+    def _sync_app_event_filter(self):
+        """按需安装/移除全局事件过滤器
+
+        只有无边框且未最大化（边缘缩放）时才需要全局过滤，
+        其余时间所有事件都不再进入 Python。
+        """
+        needed = not self._shutting_down and self._frameless_enabled and not self.isMaximized()
+        if needed == self._app_filter_installed:
+            return
+        app = QApplication.instance()
+        if app is None:
+            return
+        if needed:
+            app.installEventFilter(self)
+        else:
+            app.removeEventFilter(self)
+            # 移除前清理缩放状态，避免光标停留在缩放形状
+            self._cursor_throttle.stop()
+            self._resizing = False
+            self._resize_edges = 0
+            self._update_resize_cursor(0)
+        self._app_filter_installed = needed
+
     def eventFilter(self, watched, event):
         """全局事件过滤：实现无边框边缘缩放与边缘光标"""
+        et = event.type()
+        # 绘制、定时器、布局等绝大多数事件直接放行
+        if et not in _FILTER_EVENT_TYPES:
+            return False
+        
         # 处理工作区搜索框事件
-        if hasattr(self, 'workspace_search') and watched == self.workspace_search:
-            et = event.type()
+        if watched is self.workspace_search:
             if et == QEvent.Type.FocusIn:
                 # 获得焦点时显示下拉列表
                 self._show_workspace_popup()
@@ -812,11 +1141,11 @@ class MainWindow(QMainWindow):
                 return False
             elif et == QEvent.Type.KeyPress:
                 key = event.key()
-                popup = getattr(self, 'workspace_popup', None)
+                popup = self.workspace_popup
                 if popup is not None and popup.isVisible():
                     if key == Qt.Key.Key_Down:
                         current = popup.currentRow()
-                        if current < popup.count() - 1:
+                        if current < self._workspace_popup_rows - 1:
                             popup.setCurrentRow(current + 1)
                         return True
                     elif key == Qt.Key.Key_Up:
@@ -832,156 +1161,197 @@ class MainWindow(QMainWindow):
                     elif key == Qt.Key.Key_Escape:
                         self._hide_workspace_popup()
                         return True
+            elif et == QEvent.Type.FocusOut:
+                # 焦点可能正转移到下拉列表，待焦点稳定后再判断
+                QTimer.singleShot(0, self._check_workspace_popup_focus)
+                return False
+        elif et == QEvent.Type.FocusOut:
+            if watched is self.workspace_popup:
+                QTimer.singleShot(0, self._check_workspace_popup_focus)
+            return False
         
-        # 点击其他区域时收起工作区下拉
-        popup = getattr(self, 'workspace_popup', None)
-        if popup is not None and popup.isVisible():
-            if event.type() == QEvent.Type.MouseButtonPress:
-                global_pos = None
-                try:
-                    global_pos = event.globalPosition().toPoint()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-                if global_pos is not None:
-                    if not self._is_point_in_widget(self.workspace_search, global_pos) and not self._is_point_in_widget(popup, global_pos):
-                        self._hide_workspace_popup()
+        # 其余逻辑只关心鼠标事件
+        if et not in _MOUSE_EVENT_TYPES:
+            return False
         
-        if not getattr(self, "_frameless_enabled", False):
+        if not self._frameless_enabled:
             return super().eventFilter(watched, event)
 
-        et = event.type()
+        # 未按下鼠标的移动只用于光标提示：记录全局坐标后立即返回，
+        # 坐标映射与边缘命中测试由节流定时器按约 60Hz 处理最后一个位置
+        if et == QEvent.Type.MouseMove and not self._resizing:
+            try:
+                self._pending_cursor_pos = event.globalPosition().toPoint()  # type: ignore[attr-defined]
+            except Exception:
+                return False
+            if not self._cursor_throttle.isActive():
+                self._cursor_throttle.start()
+            return False
 
         # 最大化时不提供边缘缩放
         if self.isMaximized():
-            if et == QEvent.Type.MouseMove and not self._resizing:
-                # 恢复默认光标
-                try:
-                    self.unsetCursor()
-                except Exception:
-                    pass
             return super().eventFilter(watched, event)
 
-        if et in (QEvent.Type.MouseMove, QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease):
+        if et == QEvent.Type.MouseMove:
+            # 手动缩放（原生缩放不可用时的回退）：只记录全局坐标，每帧最多应用一次几何变更
             try:
-                global_pos = event.globalPosition().toPoint()  # type: ignore[attr-defined]
-                local_pos = self.mapFromGlobal(global_pos)
+                self._pending_resize_pos = event.globalPosition().toPoint()  # type: ignore[attr-defined]
             except Exception:
-                return super().eventFilter(watched, event)
+                return False
+            if not self._resize_throttle.isActive():
+                self._resize_throttle.start()
+            return True
 
-            # 只在窗口范围内处理
-            if not self.rect().contains(local_pos):
-                if not self._resizing:
-                    self.unsetCursor()
-                return super().eventFilter(watched, event)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
 
-            edges = self._hit_test_edges(local_pos)
+        if et == QEvent.Type.MouseButtonRelease:
+            if not self._resizing:
+                return False
+            # 松开前应用最后一次位置
+            self._resize_throttle.stop()
+            self._flush_resize()
+            self._resizing = False
+            self._resize_edges = 0
+            self._update_resize_cursor(0)
+            return True
 
-            if et == QEvent.Type.MouseMove:
-                # 正在缩放
-                if self._resizing:
-                    self._apply_resize(global_pos)
-                    return True
+        # 左键按下：仅此处需要坐标映射与边缘命中测试
+        try:
+            global_pos = event.globalPosition().toPoint()  # type: ignore[attr-defined]
+            local_pos = self.mapFromGlobal(global_pos)
+        except Exception:
+            return False
 
-                # 未按下鼠标：更新光标提示
-                if edges:
-                    self._update_resize_cursor(edges)
-                else:
-                    self.unsetCursor()
+        # 只在窗口范围内处理
+        if not self._contains_local(local_pos):
+            self._update_resize_cursor(0)
+            return False
 
-            elif et == QEvent.Type.MouseButtonPress:
-                if event.button() == Qt.MouseButton.LeftButton and edges:
-                    self._resizing = True
-                    self._resize_edges = edges
-                    self._resize_start_global = global_pos
-                    self._resize_start_geo = self.geometry()
-                    return True
-
-            elif et == QEvent.Type.MouseButtonRelease:
-                if event.button() == Qt.MouseButton.LeftButton and self._resizing:
-                    self._resizing = False
-                    self._resize_edges = set()
-                    self.unsetCursor()
-                    return True
-
-        return super().eventFilter(watched, event)
-
-    def _hit_test_edges(self, pos: QPoint) -> set[str]:
-        """判断鼠标是否在窗口边缘（用于缩放）"""
-        m = int(self._resize_margin)
-        w = self.width()
-        h = self.height()
-
-        edges: set[str] = set()
-        if pos.x() <= m:
-            edges.add("left")
-        elif pos.x() >= w - m:
-            edges.add("right")
-
-        if pos.y() <= m:
-            edges.add("top")
-        elif pos.y() >= h - m:
-            edges.add("bottom")
+        edges = self._hit_test_edges(local_pos)
+        if not edges:
+            return False
+        # 优先交给系统处理缩放（Qt 6.2+）
+        handle = self.windowHandle()
+        if handle is not None and handle.startSystemResize(self._edges_to_qt(edges)):
+            return True
+        # 回退：手动跟踪缩放
+        self._resizing = True
+        self._resize_edges = edges
+        geo = self.geometry()
+        self._resize_start = (
+            global_pos.x(), global_pos.y(),
+            geo.x(), geo.y(), geo.width(), geo.height(),
+            self.minimumWidth(), self.minimumHeight(),
+        )
+        self._applied_resize_geo = None
+        return True
+
+    def _flush_resize(self):
+        """应用最近一次缩放位置（由节流定时器触发）"""
+        pos = self._pending_resize_pos
+        self._pending_resize_pos = None
+        if pos is not None and self._resizing:
+            self._apply_resize(pos)
+
+    def _flush_resize_cursor(self):
+        """按最近一次鼠标位置更新边缘光标（由节流定时器触发）"""
+        global_pos = self._pending_cursor_pos
+        self._pending_cursor_pos = None
+        if global_pos is None or self._resizing:
+            return
+        # 最大化时不提供边缘缩放，恢复默认光标
+        if self.isMaximized():
+            self._update_resize_cursor(0)
+            return
+        pos = self.mapFromGlobal(global_pos)
+        if not self._contains_local(pos):
+            self._update_resize_cursor(0)
+            return
+        edges = self._hit_test_edges(pos)
+        self._update_resize_cursor(edges)
+
+    def _contains_local(self, pos: QPoint) -> bool:
+        """判断窗口坐标是否在窗口范围内（使用缓存尺寸）"""
+        x = pos.x()
+        y = pos.y()
+        return 0 <= x < self._cached_w and 0 <= y < self._cached_h
+
+    def _hit_test_edges(self, pos: QPoint) -> int:
+        """判断鼠标是否在窗口边缘（用于缩放），返回 _EDGE_* 位掩码"""
+        m = self._resize_margin
+        x = pos.x()
+        y = pos.y()
+        w = self._cached_w
+        h = self._cached_h
+
+        # 绝大多数情况鼠标在窗口内部，直接返回
+        if m < x < w - m and m < y < h - m:
+            return 0
+
+        edges = 0
+        if x <= m:
+            edges |= _EDGE_LEFT
+        elif x >= w - m:
+            edges |= _EDGE_RIGHT
+
+        if y <= m:
+            edges |= _EDGE_TOP
+        elif y >= h - m:
+            edges |= _EDGE_BOTTOM
 
         return edges
 
-    def _update_resize_cursor(self, edges: set[str]):
-        """根据边缘位置更新鼠标光标"""
-        if {"left", "top"}.issubset(edges) or {"right", "bottom"}.issubset(edges):
-            self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-        elif {"right", "top"}.issubset(edges) or {"left", "bottom"}.issubset(edges):
-            self.setCursor(Qt.CursorShape.SizeBDiagCursor)
-        elif "left" in edges or "right" in edges:
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-        elif "top" in edges or "bottom" in edges:
-            self.setCursor(Qt.CursorShape.SizeVerCursor)
-        else:
+    @staticmethod
+    def _edges_to_qt(edges: int) -> Qt.Edge:
+        """将边缘位掩码转换为 Qt.Edge 标志（位值与 Qt.Edge 一致）"""
+        return Qt.Edge(edges)
+
+    def _update_resize_cursor(self, edges: int):
+        """根据边缘位置更新鼠标光标（与上次相同时不重复设置）"""
+        shape = _EDGE_CURSORS[edges]
+        if shape == self._current_cursor_shape:
+            return
+        self._current_cursor_shape = shape
+        if shape is None:
             self.unsetCursor()
+        else:
+            self.setCursor(shape)
 
     def _apply_resize(self, global_pos: QPoint):
-        """按当前边缘拖拽调整窗口大小"""
-        delta = global_pos - self._resize_start_global
-        geo = QRect(self._resize_start_geo)
-
-        min_w = self.minimumWidth()
-        min_h = self.minimumHeight()
-
-        if "left" in self._resize_edges:
-            new_x = geo.x() + delta.x()
-            new_w = geo.width() - delta.x()
-            if new_w >= min_w:
-                geo.setX(new_x)
-                geo.setWidth(new_w)
-        if "right" in self._resize_edges:
-            new_w = geo.width() + delta.x()
-            if new_w >= min_w:
-                geo.setWidth(new_w)
-
-        if "top" in self._resize_edges:
-            new_y = geo.y() + delta.y()
-            new_h = geo.height() - delta.y()
-            if new_h >= min_h:
-                geo.setY(new_y)
-                geo.setHeight(new_h)
-        if "bottom" in self._resize_edges:
-            new_h = geo.height() + delta.y()
-            if new_h >= min_h:
-                geo.setHeight(new_h)
-
-        self.setGeometry(geo)
+        """按当前边缘拖拽调整窗口大小（整数运算，尺寸不小于最小值）"""
+        gx, gy, x, y, w, h, min_w, min_h = self._resize_start
+        dx = global_pos.x() - gx
+        dy = global_pos.y() - gy
+        edges = self._resize_edges
+        nx, ny, nw, nh = x, y, w, h
+
+        if edges & _EDGE_LEFT:
+            nw = max(min_w, w - dx)
+            nx = x + w - nw
+        elif edges & _EDGE_RIGHT:
+            nw = max(min_w, w + dx)
+
+        if edges & _EDGE_TOP:
+            nh = max(min_h, h - dy)
+            ny = y + h - nh
+        elif edges & _EDGE_BOTTOM:
+            nh = max(min_h, h + dy)
+
+        # 被最小尺寸钳住或鼠标回到原处时几何不变，不再触发重新布局
+        target = (nx, ny, nw, nh)
+        if target == self._applied_resize_geo:
+            return
+        self._applied_resize_geo = target
+        self.setGeometry(nx, ny, nw, nh)
     
     def _setup_workspace_search(self, toolbar):
         """设置工作区搜索框"""
-        from csv_analyzer.frontend.styles.icons import get_icon
-        
         # 工作区搜索容器
         search_container = QWidget()
         search_container.setObjectName("workspaceSearchContainer")
         search_container.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        search_container.setStyleSheet(f"""
-            QWidget#workspaceSearchContainer {{
-                background-color: {VSCODE_COLORS['titlebar_bg']};
-            }}
-        """)
+        search_container.setStyleSheet(_WORKSPACE_SEARCH_CONTAINER_QSS)
 
         search_layout = QHBoxLayout(search_container)
         search_layout.setContentsMargins(0, 0, 0, 0)
@@ -998,7 +1368,7 @@ class MainWindow(QMainWindow):
         
         # 搜索图标
         search_icon = QLabel()
-        search_icon.setPixmap(get_icon("search").pixmap(12, 12))
+        search_icon.setPixmap(get_pixmap("search", size=12))
         search_box_layout.addWidget(search_icon)
         
         # 工作区搜索框
@@ -1006,30 +1376,12 @@ class MainWindow(QMainWindow):
         self.workspace_search.setObjectName("workspaceSearch")
         self.workspace_search.setPlaceholderText("搜索工作区...")
         self.workspace_search.setFrame(False)
-        self.workspace_search.setStyleSheet(f"""
-            QLineEdit#workspaceSearch {{
-                background-color: transparent;
-                color: {VSCODE_COLORS['foreground']};
-                font-size: 10px;
-                padding: 0;
-                border: none;
-            }}
-        """)
+        self.workspace_search.setStyleSheet(_WORKSPACE_SEARCH_INPUT_QSS)
         search_box_layout.addWidget(self.workspace_search, 1)
         
         # 搜索框容器样式（与标题栏背景融合）
         search_box.setObjectName("workspaceSearchBox")
-        search_box.setStyleSheet(f"""
-            QWidget#workspaceSearchBox {{
-                background-color: {VSCODE_COLORS['titlebar_bg']};
-                border: 1px solid gray;
-                border-radius: 4px;
-            }}
-            QWidget#workspaceSearchBox:focus-within {{
-                border-color: {VSCODE_COLORS['input_focus_border']};
-                background-color: {VSCODE_COLORS['titlebar_bg']};
-            }}
-        """)
+        search_box.setStyleSheet(_WORKSPACE_SEARCH_BOX_QSS)
         
         search_layout.addWidget(search_box)
         toolbar.addWidget(search_container)
@@ -1045,7 +1397,7 @@ class MainWindow(QMainWindow):
     
     def _setup_workspace_popup(self):
         """设置工作区下拉列表"""
-        if getattr(self, 'workspace_popup', None) is not None:
+        if self.workspace_popup is not None:
             return
         # 设为主窗口子控件，避免退出阶段析构顺序问题
         self.workspace_popup = QListWidget(self)
@@ -1059,34 +1411,30 @@ class MainWindow(QMainWindow):
         self.workspace_popup.setMouseTracking(True)
         self.workspace_popup.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.workspace_popup.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.workspace_popup.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {VSCODE_COLORS['dropdown_bg']};
-                border: 1px solid {VSCODE_COLORS['border']};
-                border-radius: 6px;
-                padding: 4px;
-                outline: none;
-            }}
-            QListWidget::item {{
-                padding: 8px 12px;
-                border-radius: 4px;
-                color: {VSCODE_COLORS['foreground']};
-            }}
-            QListWidget::item:hover {{
-                background-color: {VSCODE_COLORS['hover']};
-            }}
-            QListWidget::item:selected {{
-                background-color: {VSCODE_COLORS['selection']};
-            }}
-        """)
+        self.workspace_popup.setStyleSheet(_WORKSPACE_POPUP_QSS)
         self.workspace_popup.itemClicked.connect(self._on_workspace_item_clicked)
         self.workspace_popup.currentItemChanged.connect(self._on_workspace_popup_current_changed)
+        # 焦点离开下拉列表（且不在搜索框）时收起
         self.workspace_popup.installEventFilter(self)
+        # 预先创建固定数量的条目，刷新时只更新文本/数据并切换可见性
+        folder_icon = get_icon("folder")
+        self._workspace_pool: List[QListWidgetItem] = []
+        for _ in range(_WORKSPACE_POPUP_MAX_ITEMS):
+            item = QListWidgetItem()
+            item.setIcon(folder_icon)
+            item.setHidden(True)
+            self.workspace_popup.addItem(item)
+            self._workspace_pool.append(item)
+        self._workspace_empty_item = QListWidgetItem("没有找到工作区")
+        self._workspace_empty_item.setFlags(self._workspace_empty_item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
+        self._workspace_empty_item.setHidden(True)
+        self.workspace_popup.addItem(self._workspace_empty_item)
+        self._workspace_popup_rows = 0
         self.workspace_popup.hide()
 
     def _ensure_workspace_popup(self):
         """确保下拉存在（可能在关闭时被清理）"""
-        if getattr(self, 'workspace_popup', None) is None:
+        if self.workspace_popup is None:
             self._setup_workspace_popup()
         return self.workspace_popup
     
@@ -1096,33 +1444,42 @@ class MainWindow(QMainWindow):
         if popup is None:
             return
         
-        popup.clear()
-        
-        # 获取工作区列表
-        query = self.workspace_search.text().strip()
-        if query:
-            workspaces = self.workspace_manager.search_workspaces(query)
-        else:
-            workspaces = self.workspace_manager.get_recent_workspaces()
+        # 下拉已显示且查询未变（如再次点击搜索框）时无需重建
+        query = self.workspace_search.text().strip().lower()
+        if popup.isVisible() and query == self._last_popup_query:
+            return
+        self._last_popup_query = query
         
-        # 保存映射
-        self._workspace_name_to_id = {w.name: w.id for w in workspaces}
+        # 清除当前项（恢复"转到工作区"前的文本），条目本身复用
+        popup.setCurrentRow(-1)
         
-        if not workspaces:
-            item = QListWidgetItem("没有找到工作区")
-            item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsSelectable)
-            popup.addItem(item)
+        # 从内存索引过滤工作区列表
+        if self._recent_workspace_list is None:
+            self._update_workspace_completer()
+        if query:
+            workspaces = [w for name, w in self._workspace_index if query in name]
         else:
-            for ws in workspaces[:8]:  # 最多显示8个
-                item = QListWidgetItem(f"  {ws.name}")
-                item.setIcon(get_icon("folder"))
-                item.setData(Qt.ItemDataRole.UserRole, ws.id)
-                item.setData(Qt.ItemDataRole.UserRole + 1, ws.name)  # 保存原始名称
-                popup.addItem(item)
+            workspaces = self._recent_workspace_list
+        
+        shown = workspaces[:_WORKSPACE_POPUP_MAX_ITEMS]
+        for item, ws in zip(self._workspace_pool, shown):
+            item.setText(f"  {ws.name}")
+            item.setData(Qt.ItemDataRole.UserRole, ws.id)
+            item.setData(Qt.ItemDataRole.UserRole + 1, ws.name)  # 保存原始名称
+            item.setHidden(False)
+        for item in self._workspace_pool[len(shown):]:
+            if not item.isHidden():
+                item.setData(Qt.ItemDataRole.UserRole, None)
+                item.setHidden(True)
+        self._workspace_empty_item.setHidden(bool(shown))
+        self._workspace_popup_rows = len(shown)
         
         # 定位到搜索框下方（使用搜索框容器确保对齐）
-        search_box = getattr(self, "workspace_search_box", self.workspace_search)
-        search_global_pos = search_box.mapToGlobal(search_box.rect().bottomLeft())
+        search_box = self.workspace_search_box or self.workspace_search
+        search_global_pos = self._search_box_anchor
+        if search_global_pos is None:
+            search_global_pos = search_box.mapToGlobal(search_box.rect().bottomLeft())
+            self._search_box_anchor = search_global_pos
         
         popup.setFixedWidth(search_box.width())
         # 至少显示两行高度，防止内容过少导致定位闪烁
@@ -1148,18 +1505,18 @@ class MainWindow(QMainWindow):
     
     def _hide_workspace_popup(self):
         """隐藏工作区下拉列表"""
-        popup = getattr(self, 'workspace_popup', None)
+        popup = self.workspace_popup
         if popup is not None:
             popup.hide()
 
-    def _is_point_in_widget(self, widget: QWidget, global_pos) -> bool:
-        """判断全局坐标是否在指定widget内"""
-        try:
-            rect = widget.rect()
-            mapped = widget.mapFromGlobal(global_pos)
-            return rect.contains(mapped)
-        except Exception:
-            return False
+    def _check_workspace_popup_focus(self):
+        """焦点稳定后，若焦点既不在搜索框也不在下拉列表则收起下拉"""
+        popup = self.workspace_popup
+        if popup is None or not popup.isVisible():
+            return
+        focus = QApplication.focusWidget()
+        if focus is not self.workspace_search and focus is not popup:
+            self._hide_workspace_popup()
     
     def _on_workspace_item_clicked(self, item):
         """点击工作区项"""
@@ -1170,14 +1527,20 @@ class MainWindow(QMainWindow):
         self._hide_workspace_popup()
     
     def _update_workspace_completer(self):
-        """更新工作区补全列表"""
-        workspaces = self.workspace_manager.get_recent_workspaces()
+        """重建工作区内存索引与名称映射"""
+        self._recent_workspace_list = self.workspace_manager.get_recent_workspaces()
+        all_workspaces = self.workspace_manager.list_workspaces()
+        self._workspace_index = [(w.name.lower(), w) for w in all_workspaces]
         # 保存工作区映射
-        self._workspace_name_to_id = {w.name: w.id for w in workspaces}
+        self._workspace_name_to_id = {w.name: w.id for w in all_workspaces}
+        self._last_popup_query = None
     
     def _on_workspace_search_changed(self, text: str):
-        """工作区搜索文字改变"""
-        self._update_workspace_completer()
+        """工作区搜索文字改变（防抖后再搜索）"""
+        self._search_debounce_timer.start()
+
+    def _do_workspace_search(self):
+        """执行工作区搜索并刷新下拉列表"""
         if self.workspace_search.hasFocus():
             self._show_workspace_popup()
     
@@ -1227,12 +1590,9 @@ class MainWindow(QMainWindow):
             elif reply == QMessageBox.StandardButton.Save:
                 self._save_workspace()
         
-        # 清理当前状态
-        self._clear_current_state()
-        
-        # 加载新工作区
+        # 清理当前状态，后端清空完成后再加载新工作区（避免清掉新加载的表）
         self._current_workspace_id = workspace_id
-        self._load_workspace_async()
+        self._clear_current_state(on_cleared=self._load_workspace_async)
         
         self._update_workspace_completer()
     
@@ -1260,18 +1620,45 @@ class MainWindow(QMainWindow):
         self._update_workspace_completer()
         self._show_status(f"已创建工作区: {name}")
     
+    def _ensure_welcome_page(self):
+        """获取欢迎页，首次使用时创建并连接信号"""
+        if self.welcome_page is None:
+            from csv_analyzer.frontend.components.welcome_page import WelcomePage
+            self.welcome_page = WelcomePage(self.workspace_manager)
+            self.welcome_page.open_file_requested.connect(self._on_open_file)
+            self.welcome_page.new_workspace_requested.connect(lambda: self._create_new_workspace())
+            self.welcome_page.workspace_selected.connect(self._switch_to_workspace)
+        return self.welcome_page
+    
     def _remove_welcome_page(self):
         """移除欢迎页（如果存在）"""
-        for i in range(self.data_tabs.count()):
-            if self.data_tabs.tabText(i) == "欢迎":
-                self.data_tabs.removeTab(i)
-                break
+        if self.welcome_page is None:
+            return
+        index = self.data_tabs.indexOf(self.welcome_page)
+        if index >= 0:
+            self.data_tabs.removeTab(index)
     
-    def _clear_current_state(self):
-        """清理当前工作区状态"""
-        # 关闭所有标签页
-        while self.data_tabs.count() > 0:
-            self.data_tabs.removeTab(0)
+    def _clear_current_state(self, on_cleared=None):
+        """清理当前工作区状态
+
+        界面状态同步清理；后端数据在线程池中清空，完成（或失败）后调用 on_cleared。
+        """
+        # 关闭所有标签页：屏蔽信号后一次性清空，避免逐个 removeTab 反复切换当前页
+        tabs = self.data_tabs
+        widgets = [tabs.widget(i) for i in range(tabs.count())]
+        tabs.setUpdatesEnabled(False)
+        tabs.blockSignals(True)
+        try:
+            tabs.clear()
+        finally:
+            tabs.blockSignals(False)
+            tabs.setUpdatesEnabled(True)
+        for widget in widgets:
+            # 欢迎页会复用，其余标签页控件随之销毁
+            if widget is not None and widget is not self.welcome_page:
+                widget.blockSignals(True)
+                widget.deleteLater()
+        self._on_tab_changed(-1)
         
         # 清空已加载文件
         self._loaded_files.clear()
@@ -1285,14 +1672,21 @@ class MainWindow(QMainWindow):
         self.sidebar.clear_tables()
         self.sidebar.clear_views()
         
-        # 清空后端数据（表和视图）
-        try:
-            self.ipc_client.clear_all()
-        except Exception as e:
-            print(f"清空后端数据失败: {e}")
+        self._invalidate_data_caches()
         
         # 重置修改标记
         self._workspace_dirty = False
+        
+        # 清空后端数据（表和视图），不阻塞界面
+        def on_done(_result):
+            if on_cleared is not None:
+                on_cleared()
+        
+        def on_error(error):
+            print(f"清空后端数据失败: {error}")
+            on_done(None)
+        
+        self._run_async(self.ipc_client.clear_all, on_done, on_error)
     
     def _update_window_title(self):
         """更新窗口标题"""
@@ -1305,6 +1699,7 @@ class MainWindow(QMainWindow):
     
     def _mark_workspace_dirty(self):
         """标记工作区已修改"""
+        self._dirty_serial += 1
         if not self._workspace_dirty:
             self._workspace_dirty = True
             self._update_window_title()
@@ -1380,6 +1775,7 @@ class MainWindow(QMainWindow):
         self.sidebar.table_delete_requested.connect(self._on_table_delete)
         self.sidebar.view_delete_requested.connect(self._on_view_delete)
         self.sidebar.view_export_requested.connect(self._on_export_view)
+        self.sidebar.tables_changed.connect(self._mark_column_completer_dirty)
         
         # SQL编辑器信号
         self.sql_editor.execute_requested.connect(self._execute_sql)
@@ -1403,20 +1799,21 @@ class MainWindow(QMainWindow):
     
     def _run_async(self, func, callback, error_callback=None):
         """异步执行函数"""
-        worker = AsyncWorker(func)
-        worker.finished.connect(callback)
+        task = _AsyncTask(func)
+        signals = task.signals
+        signals.finished.connect(callback)
         if error_callback:
-            worker.error.connect(error_callback)
+            signals.error.connect(error_callback)
         else:
-            worker.error.connect(lambda e: QMessageBox.critical(self, "错误", e))
+            signals.error.connect(lambda e: QMessageBox.critical(self, "错误", e))
         
-        # 保持引用防止被回收
-        self._workers.append(worker)
-        worker.finished.connect(lambda: self._workers.remove(worker) if worker in self._workers else None)
-        worker.error.connect(lambda: self._workers.remove(worker) if worker in self._workers else None)
+        # 保持引用直到结果送达（线程池复用线程，不再为每次调用创建 QThread）
+        self._workers.add(task)
+        signals.finished.connect(lambda _: self._workers.discard(task))
+        signals.error.connect(lambda _: self._workers.discard(task))
         
-        worker.start()
-        return worker
+        QThreadPool.globalInstance().start(task)
+        return task
     
     # === 文件操作 ===
     
@@ -1434,6 +1831,12 @@ class MainWindow(QMainWindow):
     
     def _refresh_tables(self):
         """刷新表列表"""
+        # 表/视图发生变化后刷新，之前的列分析结果与预取的分页可能已过期
+        self._invalidate_data_caches()
+        
+        gen = self._sql_tables_gen
+        self._sql_tables_fetching = True
+        
         def do_refresh():
             tables_resp = self.ipc_client.get_tables()
             views_resp = self.ipc_client.get_views()
@@ -1441,12 +1844,20 @@ class MainWindow(QMainWindow):
         
         def on_refreshed(result):
             tables_resp, views_resp = result
+            self._sql_tables_fetching = False
             if tables_resp.success:
                 self.sidebar.update_tables(tables_resp.data)
+                # 同一份表结构顺带更新SQL补全，无需再请求一次 get_tables
+                if gen == self._sql_tables_gen:
+                    self._apply_sql_completer_tables(tables_resp.data)
             if views_resp.success:
                 self.sidebar.update_views(views_resp.data)
         
-        self._run_async(do_refresh, on_refreshed)
+        def on_error(error):
+            self._sql_tables_fetching = False
+            QMessageBox.critical(self, "错误", error)
+        
+        self._run_async(do_refresh, on_refreshed, on_error)
     
     def _on_export(self):
         """导出当前结果"""
@@ -1489,34 +1900,51 @@ class MainWindow(QMainWindow):
         self._show_progress(True)
         
         def do_export():
-            # 执行SQL获取所有数据
-            return self.ipc_client.execute_query(sql, 1000000, 0)  # 获取大量数据
+            # 一次查询获取全部数据（分页 OFFSET 查询在无 ORDER BY 时行序不稳定），
+            # 写文件同样在工作线程中完成
+            response = self.ipc_client.execute_query(sql, _EXPORT_MAX_ROWS, 0)
+            if not response.success:
+                return response.error or "未知错误"
+            data = response.data
+            if data.get('error'):
+                return data['error']
+            with open(file_path, 'w', newline='', encoding='utf-8-sig', buffering=_EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(data['columns'])
+                writer.writerows(data['data'])
+            return None
         
-        def on_exported(response):
+        def on_exported(error):
             self._show_progress(False)
-            if response.success:
-                data = response.data
-                if data.get('error'):
-                    QMessageBox.warning(self, "导出失败", data['error'])
-                    return
-                
-                self._export_data_to_csv(file_path, data['columns'], data['data'])
+            if error:
+                QMessageBox.warning(self, "导出失败", error)
             else:
-                QMessageBox.warning(self, "导出失败", response.error or "未知错误")
+                self._show_status(f"已导出到: {file_path}")
+        
+        def on_error(error):
+            self._show_progress(False)
+            self._remove_partial_export(file_path)
+            QMessageBox.warning(self, "导出失败", f"写入文件失败: {error}")
         
-        self._run_async(do_export, on_exported)
+        self._run_async(do_export, on_exported, on_error)
     
-    def _export_data_to_csv(self, file_path: str, columns: list, data: list):
+    @staticmethod
+    def _remove_partial_export(file_path: str):
+        """删除导出失败时残留的部分文件"""
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+    
+    def _export_data_to_csv(self, file_path: str, columns: list, data: Iterable):
         """导出数据到CSV文件"""
         try:
-            import csv
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8-sig', buffering=_EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 # 写入表头
                 writer.writerow(columns)
-                # 写入数据
-                for row in data:
-                    writer.writerow(row)
+                # 写入数据（逐行循环在 _csv 的 C 实现中完成）
+                writer.writerows(data)
             self._show_status(f"已导出到: {file_path}")
         except Exception as e:
             QMessageBox.warning(self, "导出失败", f"写入文件失败: {e}")
@@ -1569,11 +1997,19 @@ class MainWindow(QMainWindow):
         self.column_search_bar.setVisible(False)
         self.column_search_input.clear()
     
+    def _mark_column_completer_dirty(self):
+        """侧边栏表列表变化，下次打开列搜索时重建补全列表"""
+        self._column_completer_dirty = True
+    
     def _update_column_completer(self):
-        """更新列搜索自动补全列表"""
+        """更新列搜索自动补全列表（表列表未变化时直接返回）"""
+        if not self._column_completer_dirty:
+            return
+        self._column_completer_dirty = False
         all_columns = self.sidebar.get_all_columns()
-        model = QStringListModel(all_columns)
-        self.column_completer.setModel(model)
+        if all_columns != self._last_completer_columns:
+            self._column_src_model.setStringList(all_columns)
+            self._last_completer_columns = all_columns
     
     def _on_column_search_enter(self):
         """列搜索回车事件"""
@@ -1634,14 +2070,23 @@ class MainWindow(QMainWindow):
         self._update_sql_completer()
     
     def _load_table_data(self, table_name: str, offset: int, limit: int, table_widget: DataTableWidget):
-        """加载表数据"""
+        """加载表数据（已预取的页直接显示）"""
+        def fetch(page_limit, page_offset):
+            return self.ipc_client.get_table_data(table_name, page_limit, page_offset)
+        
+        data = self._take_prefetched_page(table_widget, (table_name, offset, limit))
+        if data is not None:
+            table_widget.set_data(data['columns'], data['data'], data['total_rows'])
+            self._show_status(f"已加载 {len(data['data'])} / {data['total_rows']} 行")
+            self._prefetch_next_page(table_widget, table_name, fetch, offset, limit, data['total_rows'])
+            return
+        
         self._show_status(f"加载数据: {table_name}...")
         
-        import weakref
         weak_widget = weakref.ref(table_widget)
         
         def do_load():
-            return self.ipc_client.get_table_data(table_name, limit, offset)
+            return fetch(limit, offset)
         
         def on_loaded(response):
             w = weak_widget()
@@ -1657,7 +2102,8 @@ class MainWindow(QMainWindow):
                     )
                     self._show_status(f"已加载 {len(data['data'])} / {data['total_rows']} 行")
                 except RuntimeError:
-                    pass  # widget可能已被删除
+                    return  # widget可能已被删除
+                self._prefetch_next_page(w, table_name, fetch, offset, limit, data['total_rows'])
             else:
                 QMessageBox.warning(self, "加载失败", response.error or "未知错误")
         
@@ -1769,6 +2215,10 @@ class MainWindow(QMainWindow):
         self._current_sql = sql
         import weakref
         
+        # 非查询语句可能修改数据，丢弃已缓存的列分析与预取分页
+        if not sql.lstrip()[:6].upper().startswith(("SELECT", "WITH")):
+            self._invalidate_data_caches()
+        
         def do_execute():
             return self.ipc_client.execute_query(sql, 1000, 0)
         
@@ -1836,6 +2286,12 @@ class MainWindow(QMainWindow):
                         )
                     except RuntimeError:
                         widget = None
+                if widget is not None:
+                    self._prefetch_next_page(
+                        widget, sql,
+                        lambda page_limit, page_offset: self.ipc_client.execute_query(sql, page_limit, page_offset),
+                        0, 1000, data['total_rows']
+                    )
                 
                 exec_time = data.get('execution_time', 0)
                 self._show_status(f"查询完成: {data['total_rows']} 行, 耗时 {exec_time:.3f}s")
@@ -1845,12 +2301,20 @@ class MainWindow(QMainWindow):
         self._run_async(do_execute, on_executed)
     
     def _execute_sql_page(self, sql: str, offset: int, limit: int, result_widget: DataTableWidget):
-        """执行SQL分页查询"""
-        import weakref
+        """执行SQL分页查询（已预取的页直接显示）"""
+        def fetch(page_limit, page_offset):
+            return self.ipc_client.execute_query(sql, page_limit, page_offset)
+        
+        data = self._take_prefetched_page(result_widget, (sql, offset, limit))
+        if data is not None:
+            result_widget.set_data(data['columns'], data['data'], data['total_rows'])
+            self._prefetch_next_page(result_widget, sql, fetch, offset, limit, data['total_rows'])
+            return
+        
         weak_widget = weakref.ref(result_widget)
         
         def do_execute():
-            return self.ipc_client.execute_query(sql, limit, offset)
+            return fetch(limit, offset)
         
         def on_executed(response):
             w = weak_widget()
@@ -1866,10 +2330,45 @@ class MainWindow(QMainWindow):
                             data['total_rows']
                         )
                     except RuntimeError:
-                        pass  # widget可能已被删除
+                        return  # widget可能已被删除
+                    self._prefetch_next_page(w, sql, fetch, offset, limit, data['total_rows'])
         
         self._run_async(do_execute, on_executed)
     
+    def _take_prefetched_page(self, widget: DataTableWidget, key: tuple) -> Optional[dict]:
+        """取出已预取的分页数据（没有则返回 None）"""
+        entry = self._page_caches.get(widget)
+        if entry is None:
+            return None
+        return entry[0].pop(key, None)
+    
+    def _prefetch_next_page(self, widget: DataTableWidget, source: str, fetch, offset: int, limit: int, total_rows: int):
+        """在后台预取下一页，用户向后翻页时无需等待查询"""
+        next_offset = offset + limit
+        if next_offset >= total_rows:
+            return
+        key = (source, next_offset, limit)
+        entry = self._page_caches.get(widget)
+        if entry is None:
+            entry = self._page_caches[widget] = ({}, set())
+        pages, inflight = entry
+        if key in pages or key in inflight:
+            return
+        inflight.add(key)
+        
+        def on_fetched(response):
+            inflight.discard(key)
+            if response.success and response.data and not response.data.get('error'):
+                pages[key] = response.data
+                # 只保留最近的几页
+                while len(pages) > _PREFETCH_MAX_PAGES:
+                    pages.pop(next(iter(pages)))
+        
+        def on_error(_error):
+            inflight.discard(key)
+        
+        self._run_async(lambda: fetch(limit, next_offset), on_fetched, on_error)
+    
     # === 分析功能 ===
     
     def _load_analysis(self, table_name: str):
@@ -1877,6 +2376,7 @@ class MainWindow(QMainWindow):
         self.cell_inspector.set_table_name(table_name)
         # 清空之前的分析结果
         self.cell_inspector.clear()
+        self._last_analysis_key = None
     
     # === UI操作 ===
     
@@ -1933,18 +2433,31 @@ class MainWindow(QMainWindow):
         self.toggle_sql_btn.setChecked(visible)
     
     def _update_sql_completer(self):
-        """更新SQL自动补全的表名列表"""
-        try:
-            resp = self.ipc_client.get_tables()
-            if resp.success and resp.data:
-                tables_info = {}
-                for table in resp.data:
-                    table_name = table['name']
-                    columns = [col['name'] for col in table.get('columns', [])]
-                    tables_info[table_name] = columns
-                self.sql_editor.set_tables(tables_info)
-        except Exception as e:
-            print(f"更新SQL补全表名失败: {e}")
+        """更新SQL自动补全的表名列表（表结构未变化或已在获取时直接返回）"""
+        if not self._sql_tables_dirty or self._sql_tables_fetching:
+            return
+        gen = self._sql_tables_gen
+        self._sql_tables_fetching = True
+        
+        def on_loaded(resp):
+            self._sql_tables_fetching = False
+            if resp.success and resp.data is not None and gen == self._sql_tables_gen:
+                self._apply_sql_completer_tables(resp.data)
+        
+        def on_error(error):
+            self._sql_tables_fetching = False
+            print(f"更新SQL补全表名失败: {error}")
+        
+        self._run_async(self.ipc_client.get_tables, on_loaded, on_error)
+    
+    def _apply_sql_completer_tables(self, tables: list):
+        """用 get_tables 的结果设置SQL补全的表名/列名"""
+        tables_info = {
+            table['name']: [col['name'] for col in table.get('columns', [])]
+            for table in tables
+        }
+        self.sql_editor.set_tables(tables_info)
+        self._sql_tables_dirty = False
     
     def _on_cell_selected(self, row: int, col: int, column_name: str, value):
         """处理单元格选中"""
@@ -1960,16 +2473,48 @@ class MainWindow(QMainWindow):
             # 检查是表还是查询结果
             table_name = current_widget.get_current_table()
             current_sql = current_widget.get_current_sql()
+            key = (table_name, current_sql, column_name) if (table_name or current_sql) else None
             
-            if table_name:
-                # 对于表，调用后端分析整个表的列
-                self._load_column_analysis_from_backend(table_name, column_name)
-            elif current_sql:
-                # 对于查询结果，使用SQL分析
-                self._load_column_analysis_from_sql(current_sql, column_name)
-            else:
-                # 回退到本地分析（只分析当前页）
-                self._load_column_analysis_from_widget(column_name, current_widget)
+            # 仍在已分析的列内移动：面板内容不变，取消尚未执行的分析
+            if key is not None and key == self._last_analysis_key:
+                self._analysis_timer.stop()
+                self._pending_analysis = None
+                return
+            
+            self._pending_analysis = (key, column_name, weakref.ref(current_widget))
+            self._analysis_timer.start()
+    
+    def _fire_pending_analysis(self):
+        """执行防抖后最后一次单元格选中对应的列分析"""
+        pending = self._pending_analysis
+        self._pending_analysis = None
+        if pending is None:
+            return
+        key, column_name, widget_ref = pending
+        widget = widget_ref()
+        if widget is None:
+            return
+        self._last_analysis_key = key
+        
+        if key is None:
+            # 回退到本地分析（只分析当前页）
+            self._load_column_analysis_from_widget(column_name, widget)
+            return
+        table_name, current_sql, _ = key
+        if table_name:
+            # 对于表，调用后端分析整个表的列
+            self._load_column_analysis_from_backend(table_name, column_name)
+        else:
+            # 对于查询结果，使用SQL分析
+            self._load_column_analysis_from_sql(current_sql, column_name)
+    
+    def _invalidate_data_caches(self):
+        """数据可能已变化：丢弃列分析缓存与预取分页，下次选中单元格时重新分析"""
+        self._column_analysis_cache.clear()
+        self._page_caches.clear()
+        self._last_analysis_key = None
+        self._sql_tables_dirty = True
+        self._sql_tables_gen += 1
     
     def _on_tab_changed(self, index: int):
         """处理Tab切换"""
@@ -2018,28 +2563,56 @@ class MainWindow(QMainWindow):
         if self._current_table:
             self._load_column_analysis(column_name)
     
+    def _get_cached_column_analysis(self, key: tuple, column_name: str) -> bool:
+        """命中列分析缓存时直接显示结果并返回 True"""
+        data = self._column_analysis_cache.get(key)
+        if data is None:
+            return False
+        self._column_analysis_cache.move_to_end(key)
+        self.cell_inspector.set_column_analysis(column_name, data)
+        return True
+    
+    def _store_column_analysis(self, key: tuple, data):
+        """写入列分析缓存，超出容量时淘汰最久未使用的条目"""
+        cache = self._column_analysis_cache
+        cache[key] = data
+        cache.move_to_end(key)
+        if len(cache) > _COLUMN_ANALYSIS_CACHE_SIZE:
+            cache.popitem(last=False)
+    
     def _load_column_analysis(self, column_name: str):
         """加载列分析数据"""
-        if not self._current_table:
+        table_name = self._current_table
+        if not table_name:
+            return
+        self._last_analysis_key = None
+        key = ("table", table_name, column_name)
+        if self._get_cached_column_analysis(key, column_name):
             return
         
         def do_analyze():
             # 获取列分析数据
-            return self.ipc_client.analyze_column(self._current_table, column_name)
+            return self.ipc_client.analyze_column(table_name, column_name)
         
         def on_analyzed(response):
             if response.success and response.data:
+                self._store_column_analysis(key, response.data)
                 self.cell_inspector.set_column_analysis(column_name, response.data)
         
         self._run_async(do_analyze, on_analyzed)
     
     def _load_column_analysis_from_backend(self, table_name: str, column_name: str):
         """从后端加载列分析数据（整个表）"""
+        key = ("table", table_name, column_name)
+        if self._get_cached_column_analysis(key, column_name):
+            return
+        
         def do_analyze():
             return self.ipc_client.analyze_column(table_name, column_name)
         
         def on_analyzed(response):
             if response.success and response.data:
+                self._store_column_analysis(key, response.data)
                 self.cell_inspector.set_column_analysis(column_name, response.data)
             else:
                 # 如果后端分析失败，回退到本地分析
@@ -2051,11 +2624,16 @@ class MainWindow(QMainWindow):
     
     def _load_column_analysis_from_sql(self, sql: str, column_name: str):
         """从SQL查询加载列分析数据（整个查询结果）"""
+        key = ("sql", sql, column_name)
+        if self._get_cached_column_analysis(key, column_name):
+            return
+        
         def do_analyze():
             return self.ipc_client.analyze_column_sql(sql, column_name)
         
         def on_analyzed(response):
             if response.success and response.data:
+                self._store_column_analysis(key, response.data)
                 self.cell_inspector.set_column_analysis(column_name, response.data)
             else:
                 # 如果后端分析失败，回退到本地分析
@@ -2072,56 +2650,7 @@ class MainWindow(QMainWindow):
             if not column_data:
                 return
             
-            # 本地计算统计信息
-            import statistics
-            
-            total_rows = len(column_data)
-            missing_count = sum(1 for v in column_data if v is None or str(v) == 'NULL' or str(v) == '')
-            non_null_values = [v for v in column_data if v is not None and str(v) != 'NULL' and str(v) != '']
-            unique_count = len(set(str(v) for v in non_null_values))
-            missing_pct = (missing_count / total_rows * 100) if total_rows > 0 else 0
-            
-            # 判断数据类型
-            numeric_values = []
-            for v in non_null_values:
-                try:
-                    numeric_values.append(float(v))
-                except (ValueError, TypeError):
-                    pass
-            
-            is_numeric = len(numeric_values) > len(non_null_values) * 0.5
-            
-            analysis = {
-                'dtype': 'numeric' if is_numeric else 'text',
-                'total_rows': total_rows,
-                'unique_count': unique_count,
-                'missing_count': missing_count,
-                'missing_percentage': missing_pct,
-                'is_numeric': is_numeric,
-            }
-            
-            # 数值统计 - 使用 numeric_stats 字典格式
-            if is_numeric and numeric_values:
-                numeric_stats = {
-                    'min': min(numeric_values),
-                    'max': max(numeric_values),
-                    'mean': statistics.mean(numeric_values),
-                    'median': statistics.median(numeric_values),
-                }
-                if len(numeric_values) > 1:
-                    numeric_stats['std'] = statistics.stdev(numeric_values)
-                    sorted_vals = sorted(numeric_values)
-                    n = len(sorted_vals)
-                    numeric_stats['q1'] = sorted_vals[n // 4]
-                    numeric_stats['q3'] = sorted_vals[3 * n // 4]
-                analysis['numeric_stats'] = numeric_stats
-            
-            # Top值统计 - 使用元组列表格式 [(value, count), ...]
-            from collections import Counter
-            value_counts = Counter(str(v) for v in non_null_values)
-            top_values = value_counts.most_common(10)
-            analysis['top_values'] = top_values  # 保持元组格式
-            
+            analysis = _analyze_column_values(column_data)
             self.cell_inspector.set_column_analysis(column_name, analysis)
         except Exception as e:
             print(f"本地列分析失败: {e}")
@@ -2179,7 +2708,7 @@ class MainWindow(QMainWindow):
         """分阶段关闭：先清理前端资源，再停后端，最后退出主进程"""
         # 收起并销毁弹出控件
         try:
-            popup = getattr(self, 'workspace_popup', None)
+            popup = self.workspace_popup
             if popup:
                 popup.removeEventFilter(self)
                 popup.hide()
@@ -2188,28 +2717,22 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # 移除事件过滤器
+        # 移除事件过滤器（_shutting_down 已置位，同步后不会再安装）
         try:
-            app = QApplication.instance()
-            if app is not None:
-                app.removeEventFilter(self)
+            self._sync_app_event_filter()
         except Exception:
             pass
 
-        # 停止所有异步工作线程
-        for worker in list(self._workers):
-            try:
-                if worker.isRunning():
-                    worker.quit()
-                    worker.wait(1000)
-            except Exception:
-                pass
+        # 等待线程池中的异步任务结束
+        try:
+            QThreadPool.globalInstance().waitForDone(1000)
+        except Exception:
+            pass
         self._workers.clear()
 
         # 停止后端
         try:
-            if hasattr(self, 'ipc_client'):
-                self.ipc_client.stop()
+            self.ipc_client.stop()
         except Exception:
             pass
 
@@ -2222,7 +2745,61 @@ class MainWindow(QMainWindow):
     # === 工作区管理 ===
     
     def _save_workspace(self) -> bool:
-        """保存工作区，返回是否成功"""
+        """同步保存工作区，返回是否成功（用于关闭/切换前必须先保存完成的场景）"""
+        config = self._build_workspace_config()
+        if config is None:
+            return False
+        try:
+            resp = self.ipc_client.get_views()
+            if resp.success:
+                config.views = resp.data
+        except Exception:
+            pass
+        return self._finish_save_workspace(config, self._dirty_serial)
+    
+    def _save_workspace_async(self):
+        """保存工作区：视图定义在线程池中获取，写盘仍在主线程完成"""
+        if self._save_in_flight:
+            return
+        config = self._build_workspace_config()
+        if config is None:
+            return
+        
+        self._save_in_flight = True
+        dirty_serial = self._dirty_serial
+        self._show_status("正在保存工作区...")
+        
+        def on_views(resp):
+            if resp.success:
+                config.views = resp.data
+            self._save_in_flight = False
+            self._finish_save_workspace(config, dirty_serial)
+        
+        def on_error(_error):
+            # 获取视图失败时仍保存其余配置
+            self._save_in_flight = False
+            self._finish_save_workspace(config, dirty_serial)
+        
+        self._run_async(self.ipc_client.get_views, on_views, on_error)
+    
+    def _finish_save_workspace(self, config: WorkspaceConfig, dirty_serial: int) -> bool:
+        """写入工作区配置并更新界面状态
+
+        dirty_serial 为收集配置时的修改序号，之后又有修改则保留修改标记。
+        """
+        if self.workspace_manager.save(config):
+            if dirty_serial == self._dirty_serial:
+                # 清除修改标记
+                self._workspace_dirty = False
+                self._update_window_title()
+            self._show_status(f"工作区 \"{self._current_workspace_name}\" 已保存")
+            return True
+        else:
+            QMessageBox.warning(self, "保存失败", "无法保存工作区，请检查磁盘空间和权限。")
+            return False
+    
+    def _build_workspace_config(self) -> Optional[WorkspaceConfig]:
+        """收集当前界面状态生成工作区配置（视图除外），用户取消命名时返回 None"""
         # 确保有工作区ID
         if not self._current_workspace_id:
             # 创建新工作区
@@ -2231,7 +2808,7 @@ class MainWindow(QMainWindow):
                 text="新工作区"
             )
             if not ok or not name.strip():
-                return False
+                return None
             config = self.workspace_manager.create_workspace(name.strip())
             self._current_workspace_id = config.id
             self._current_workspace_name = config.name
@@ -2272,27 +2849,7 @@ class MainWindow(QMainWindow):
         
         # 保存SQL
         config.last_sql = self.sql_editor.get_sql()
-        
-        # 保存视图
-        try:
-            resp = self.ipc_client.get_views()
-            if resp.success:
-                config.views = resp.data
-        except:
-            pass
-        
-        # 执行保存
-        success = self.workspace_manager.save(config)
-        
-        if success:
-            # 清除修改标记
-            self._workspace_dirty = False
-            self._update_window_title()
-            self._show_status(f"工作区 \"{self._current_workspace_name}\" 已保存")
-            return True
-        else:
-            QMessageBox.warning(self, "保存失败", "无法保存工作区，请检查磁盘空间和权限。")
-            return False
+        return config
     
     def _load_workspace_async(self):
         """异步加载工作区 - 不阻塞UI"""
@@ -2329,56 +2886,45 @@ class MainWindow(QMainWindow):
         if config.last_sql:
             self.sql_editor.set_sql(config.last_sql)
         
-        # 逐个异步加载CSV文件，避免阻塞
+        # 一次请求批量加载全部CSV文件，避免阻塞
         files_to_load = [f for f in config.loaded_files if os.path.exists(f)]
-        self._pending_files = files_to_load.copy()
-        self._total_files_to_load = len(files_to_load)  # 记录总数
         self._workspace_config = config  # 保存配置用于后续恢复
         
-        if files_to_load:
-            self._show_status(f"正在加载工作区: 第 1/{len(files_to_load)} 个文件...", timeout=0)
-            self._load_next_workspace_file()
-        else:
+        if not files_to_load:
             # 没有文件要加载，直接完成
             self._finish_workspace_load()
-    
-    def _load_next_workspace_file(self):
-        """加载下一个工作区文件"""
-        if not self._pending_files:
-            self._finish_workspace_load()
             return
         
-        filepath = self._pending_files.pop(0)
-        total = getattr(self, '_total_files_to_load', 1)
-        current = total - len(self._pending_files)
-        
-        self._show_status(f"正在加载: 第 {current}/{total} 个文件 - {os.path.basename(filepath)}", timeout=0)
+        self._show_status(f"正在加载工作区: {len(files_to_load)} 个文件...", timeout=0)
         
         def do_load():
-            return self.ipc_client.load_csv(filepath)
+            return self.ipc_client.load_csv_batch(files_to_load)
         
         def on_loaded(response):
             if response.success:
-                table_name = response.data.get('name', os.path.basename(filepath))
-                if filepath not in self._loaded_files:
-                    self._loaded_files.append(filepath)
-                # 记录表名到文件路径的映射
-                self._table_to_file[table_name] = filepath
-                self.workspace_manager.add_recent_file(filepath)
-            
-            # 继续加载下一个文件
-            QTimer.singleShot(50, self._load_next_workspace_file)
+                for result in response.data:
+                    filepath = result['file_path']
+                    if not result['success']:
+                        print(f"加载文件失败: {filepath} - {result.get('error')}")
+                        continue
+                    if filepath not in self._loaded_files:
+                        self._loaded_files.append(filepath)
+                    # 记录表名到文件路径的映射
+                    self._table_to_file[result.get('name') or os.path.basename(filepath)] = filepath
+                    self.workspace_manager.add_recent_file(filepath)
+            else:
+                print(f"加载工作区文件失败: {response.error}")
+            self._finish_workspace_load()
         
         def on_error(error):
-            print(f"加载文件失败: {filepath} - {error}")
-            # 继续加载下一个文件
-            QTimer.singleShot(50, self._load_next_workspace_file)
+            print(f"加载工作区文件失败: {error}")
+            self._finish_workspace_load()
         
         self._run_async(do_load, on_loaded, on_error)
     
     def _finish_workspace_load(self):
         """完成工作区加载"""
-        config = getattr(self, '_workspace_config', None)
+        config = self._workspace_config
         
         # 刷新表列表
         self._refresh_tables()
@@ -2386,8 +2932,7 @@ class MainWindow(QMainWindow):
         self._update_sql_completer()
         
         # 更新工作区搜索补全
-        if hasattr(self, '_update_workspace_completer'):
-            self._update_workspace_completer()
+        self._update_workspace_completer()
         
         if config:
             # 恢复视图
@@ -2,7 +2,7 @@
 SVG图标管理模块 - 统一管理所有图标
 """
 
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QPixmapCache
 from PyQt6.QtCore import Qt, QByteArray, QSize, QRectF
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import QApplication
@@ -15,6 +15,9 @@ class IconManager:
     
     # 缓存已创建的图标
     _cache: dict = {}
+    # QPixmapCache 容量（KB），默认 10MB 对多尺寸图标偏小
+    PIXMAP_CACHE_LIMIT_KB = 20 * 1024
+    _pixmap_cache_limit_set = False
     
     # SVG图标定义
     ICONS = {
@@ -389,13 +392,7 @@ class IconManager:
             color = VSCODE_COLORS['foreground']
         
         # 设备像素比会影响清晰度，需纳入缓存键
-        dpr = 1.0
-        try:
-            app = QApplication.instance()
-            if app and app.primaryScreen():
-                dpr = float(app.primaryScreen().devicePixelRatio() or 1.0)
-        except Exception:
-            dpr = 1.0
+        dpr = cls._device_pixel_ratio()
 
         cache_key = f"{name}_{color}_{size}_{int(dpr * 100)}"
         
@@ -441,6 +438,17 @@ class IconManager:
         
         return icon
     
+    @classmethod
+    def _device_pixel_ratio(cls) -> float:
+        """获取主屏幕的设备像素比"""
+        try:
+            app = QApplication.instance()
+            if app and app.primaryScreen():
+                return float(app.primaryScreen().devicePixelRatio() or 1.0)
+        except Exception:
+            pass
+        return 1.0
+    
     @classmethod
     def _svg_to_icon(cls, svg_data: str, size: int, dpr: float) -> QIcon:
         """将SVG数据转换为QIcon（高DPI清晰，且不裁切）"""
@@ -466,12 +474,26 @@ class IconManager:
     
     @classmethod
     def get_pixmap(cls, name: str, color: str = None, size: int = 16) -> QPixmap:
-        """获取Pixmap"""
-        icon = cls.get_icon(name, color, size)
-        return icon.pixmap(QSize(size, size))
+        """获取Pixmap（通过 QPixmapCache 按名称、颜色、尺寸缓存，避免重复光栅化）"""
+        if not cls._pixmap_cache_limit_set:
+            if QPixmapCache.cacheLimit() < cls.PIXMAP_CACHE_LIMIT_KB:
+                QPixmapCache.setCacheLimit(cls.PIXMAP_CACHE_LIMIT_KB)
+            cls._pixmap_cache_limit_set = True
+        
+        cache_key = f"icon:{name}_{color}_{size}x{size}_{int(cls._device_pixel_ratio() * 100)}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = cls.get_icon(name, color, size).pixmap(QSize(size, size))
+            QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
 
 
 # 便捷函数
 def get_icon(name: str, color: str = None, size: int = 16) -> QIcon:
     """获取图标的便捷函数"""
     return IconManager.get_icon(name, color, size)
+
+
+def get_pixmap(name: str, color: str = None, size: int = 16) -> QPixmap:
+    """获取Pixmap的便捷函数"""
+    return IconManager.get_pixmap(name, color, size)
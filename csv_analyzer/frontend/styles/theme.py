@@ -2,6 +2,8 @@
 VSCode风格的主题样式
 """
 
+from dataclasses import make_dataclass
+
 # VSCode Dark+ 主题色
 VSCODE_COLORS = {
     # 基础颜色
@@ -89,6 +91,12 @@ VSCODE_COLORS = {
     "window_radius": "10px",
 }
 
+# 属性访问形式的主题色（C.titlebar_bg），字段与 VSCODE_COLORS 的键一一对应
+_Colors = make_dataclass(
+    "_Colors", [(name, str) for name in VSCODE_COLORS], frozen=True, slots=True
+)
+C = _Colors(**VSCODE_COLORS)
+
 
 def get_main_stylesheet() -> str:
     """获取主样式表"""